@@ -164,6 +164,10 @@ class SafePDFController:
         if self.operation_running:
             return False, "Operation is already running!"
 
+        # A cancel request from a previous run must not stop this one
+        if hasattr(self.pdf_ops, "reset_cancel"):
+            self.pdf_ops.reset_cancel()
+
         # Start operation in a separate thread
         self.operation_running = True
         thread = Thread(target=self._run_operation_thread, args=(output_path, output_dir), daemon=True)
@@ -184,7 +188,13 @@ class SafePDFController:
             elif self.selected_operation == "split":
                 method = self.operation_settings.get("method", "pages")
                 page_range = self.operation_settings.get("page_range", None)
-                success, message = self.pdf_ops.split_pdf(self.selected_file, output_dir, method, page_range)
+                try:
+                    chunk_size = max(1, int(self.operation_settings.get("chunk_size", 1)))
+                except (TypeError, ValueError):
+                    chunk_size = 1
+                success, message = self.pdf_ops.split_pdf(
+                    self.selected_file, output_dir, method, page_range, chunk_size
+                )
 
             elif self.selected_operation == "rotate":
                 angle = int(self.operation_settings.get("angle", 90))
@@ -221,7 +231,8 @@ class SafePDFController:
                 # PDF to Word conversion
                 base_name = os_path.splitext(self.selected_file)[0]
                 output_path = f"{base_name}.docx"
-                success, message = self.pdf_ops.pdf_to_word(self.selected_file, output_path)
+                include_images = bool(self.operation_settings.get("include_images", True))
+                success, message = self.pdf_ops.pdf_to_word(self.selected_file, output_path, include_images)
 
             elif self.selected_operation == "to_txt":
                 # PDF to TXT conversion
@@ -235,6 +246,9 @@ class SafePDFController:
                 output_path = f"{base_name}_info.txt"
                 success, message = self.pdf_ops.extract_hidden_info(self.selected_file, output_path)
 
+            # A progress value still held back by the throttle must not land after the final state
+            self._finish_progress()
+
             # Store current output location
             self.current_output = output_path or output_dir if success else None
 
@@ -243,15 +257,22 @@ class SafePDFController:
                 self.completion_callback(success, message, self.current_output)
 
         except Exception as e:
+            self._finish_progress()
             error_msg = f"Operation failed with error: {str(e)}"
             if self.completion_callback:
                 self.completion_callback(False, error_msg, None)
         finally:
             self.operation_running = False
 
+    def _finish_progress(self):
+        """Drop a progress update pdf_ops still holds back, before the completion callback sets the final state"""
+        if hasattr(self.pdf_ops, "finish_progress"):
+            self.pdf_ops.finish_progress()
+
     def cancel_operation(self):
         """Cancel the current operation (if possible)"""
-        # Cooperative cancellation: ask pdf_ops to cancel and clear flags
+        # Cooperative cancellation: ask pdf_ops to cancel; the worker thread clears
+        # operation_running when it actually stops
         try:
             if hasattr(self.pdf_ops, "request_cancel"):
                 self.pdf_ops.request_cancel()
@@ -268,8 +289,9 @@ class SafePDFController:
 
             time.sleep(0.05)
 
-        # Force-clear running flag as last resort
-        self.operation_running = False
+        # operation_running is deliberately left to the worker's finally: clearing it here
+        # would let the next operation reset the shared cancel event while this worker
+        # is still running, undoing the cancel
 
     def activate_pro_features(self, license_file_path):
         """Activate pro features by verifying and copying the license file"""
@@ -339,9 +361,9 @@ class SafePDFController:
         """Check for available updates from GitHub Releases"""
         return self.updates.check_for_updates()
 
-    def download_update(self, download_url, signature_url):
+    def download_update(self, download_url, signature_url, checksum_url=None):
         """Download and verify an update"""
-        return self.updates.download_and_verify(download_url, signature_url)
+        return self.updates.download_and_verify(download_url, signature_url, checksum_url=checksum_url)
 
     def get_release_info(self, version=None):
         """Get information about a specific release"""
@@ -367,7 +389,6 @@ class SafePDFController:
         self.selected_file = None
         self.selected_operation = None
         self.operation_settings = {}
-        self.operation_running = False
         self.current_output = None
         self.current_tab = 0
 
@@ -375,6 +396,8 @@ class SafePDFController:
         self.operation_settings.clear()
 
         # Reset PDF operations handler (clears any cached data)
+        if hasattr(self.pdf_ops, "_close_cached_docs"):
+            self.pdf_ops._close_cached_docs()
         if hasattr(self.pdf_ops, "_fitz"):
             setattr(self.pdf_ops, "_fitz", None)
         if hasattr(self.pdf_ops, "_imagetk"):
@@ -4,21 +4,108 @@ Handles PDF to Word document conversion operations
 """
 
 import os
-from os import path as os_path
-from tempfile import mkstemp as tmp_mkstemp
-from typing import Tuple
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
+from typing import Iterator, List, Optional, Tuple
 
 import pypdfium2 as pdfium
-from PIL import Image
-from PyPDF2 import PdfReader
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    from docx import Document
+    from docx.shared import Inches
+except ImportError:
+    Document = Inches = None
 
 from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.pdf_io import pdfium_page_text
+
+# Documents with at least this many pages are extracted and rendered in a
+# process pool; below it the pool start-up cost outweighs the gain
+PARALLEL_WORD_MIN_PAGES = 8
+PARALLEL_WORD_MAX_WORKERS = 4
+
+# Characters python-docx rejects as not XML compatible: control characters, lone surrogates,
+# U+FFFE and U+FFFF. PDFium emits some of them (e.g. \x02 for soft hyphens)
+_XML_INVALID_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def _render_page_png(pdf, page_num: int) -> Optional[bytes]:
+    """
+    Render a single page to PNG bytes
+
+    Args:
+        pdf: Open pypdfium2 PdfDocument
+        page_num: Zero-based page index
+
+    Returns:
+        PNG bytes, or None if the page could not be rendered
+    """
+    try:
+        page = pdf[page_num]
+        # Let pdfium emit RGB directly; the default BGR bitmap is swizzled by to_pil()
+        pil_image = page.render(scale=2.0, rev_byteorder=True).to_pil()
+        buffer = BytesIO()
+        pil_image.save(buffer, "PNG")
+        return buffer.getvalue()
+    except Exception:
+        return None  # Continue without images if conversion fails
+
+
+def _iter_page_contents(
+    pdf, start: int, stop: int, include_images: bool = True
+) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    Yield the text and rendered image of pages [start, stop)
+
+    Args:
+        pdf: Open pypdfium2 PdfDocument, used for both text and images
+        start: First page index (inclusive)
+        stop: Last page index (exclusive)
+        include_images: Render page images; when False only text is extracted
+
+    Yields:
+        Tuple of (page text, PNG bytes or None)
+    """
+    for page_num in range(start, stop):
+        text = _XML_INVALID_CHARS_RE.sub("", pdfium_page_text(pdf, page_num))
+        image_bytes = _render_page_png(pdf, page_num) if include_images else None
+        yield text, image_bytes
+
+
+def _extract_page_contents(
+    input_path: str, start: int, stop: int, include_images: bool = True
+) -> List[Tuple[str, Optional[bytes]]]:
+    """
+    Extract the text and rendered image of pages [start, stop) in a worker process
+
+    Args:
+        input_path: Path to input PDF file
+        start: First page index (inclusive)
+        stop: Last page index (exclusive)
+        include_images: Render page images; when False only text is extracted
+
+    Returns:
+        List of (page text, PNG bytes or None) tuples
+    """
+    pdf = pdfium.PdfDocument(input_path)
+    try:
+        return list(_iter_page_contents(pdf, start, stop, include_images))
+    finally:
+        pdf.close()
 
 
 class PDFToWordConverter:
     """Class handling PDF to Word/DOCX conversion operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None, atomic_write_via_path=None):
+    def __init__(self, progress_callback=None, language_manager=None, atomic_write_via_path=None, cancel_event=None):
         """
         Initialize PDF to Word converter
 
@@ -26,11 +113,12 @@ class PDFToWordConverter:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
             atomic_write_via_path: Function for atomic file writing via path
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
         self._atomic_write_via_path = atomic_write_via_path
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDF2Word")
 
     def update_progress(self, value):
@@ -40,25 +128,22 @@ class PDFToWordConverter:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
-    def pdf_to_word(self, input_path: str, output_path: str) -> Tuple[bool, str]:
+    def pdf_to_word(self, input_path: str, output_path: str, include_images: bool = True) -> Tuple[bool, str]:
         """
-        Convert PDF to Word document using PyPDF2 for text and pypdfium2 for images
+        Convert PDF to Word document, taking text and page images from one pypdfium2 document
 
         Args:
             input_path: Path to input PDF file
             output_path: Path to output DOCX file
+            include_images: Embed a rendered image of each page; False skips rendering for a text-only document
 
         Returns:
             Tuple of (success: bool, message: str)
         """
         try:
-            # Try to import python-docx
-            try:
-                from docx import Document
-                from docx.shared import Inches
-            except ImportError:
+            if not Document:
                 return (
                     False,
                     self.language_manager.get(
@@ -68,69 +153,53 @@ class PDFToWordConverter:
                     else "python-docx not installed. Please install with: pip install python-docx",
                 )
 
-            if not PdfReader:
+            if not pdfium:
                 return False, self.language_manager.get(
-                    "op_pypdf_unavailable", "PyPDF2/pypdf not available"
-                ) if self.language_manager else "PyPDF2/pypdf not available"
+                    "op_pypdfium_unavailable", "pypdfium2 not available. Install with: pip install pypdfium2"
+                ) if self.language_manager else "pypdfium2 not available. Install with: pip install pypdfium2"
 
-            # Open PDF with PyPDF2
+            # Page images need Pillow; without it the document is text-only
+            include_images = include_images and Image is not None
             doc = Document()
 
-            with open(input_path, "rb") as file:
-                reader = PdfReader(file)
-                total_pages = len(reader.pages)
-
-                for page_num in range(total_pages):
-                    self.update_progress(int((page_num + 1) / total_pages * 100))
-                    if self._cancel_requested:
-                        return False, self.language_manager.get(
-                            "op_word_cancelled", "Operation cancelled"
-                        ) if self.language_manager else "Operation cancelled"
-
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-
-                    # Add page content to document
-                    doc.add_heading(f"Page {page_num + 1}", level=1)
-                    if text.strip():
-                        doc.add_paragraph(text)
-                    else:
-                        doc.add_paragraph("[No text content detected on this page]")
-
-                    # Try to extract images using pypdfium2 if available
-                    if pdfium and Image:
-                        try:
-                            # Open PDF and render single page
-                            pdf = pdfium.PdfDocument(input_path)
-                            if page_num < len(pdf):
-                                page = pdf[page_num]
-                                pil_image = page.render(scale=2.0).to_pil()
-
-                                # Save image temporarily
-                                tmp_fd = None
-                                tmp_name = None
-                                try:
-                                    tmp_fd, tmp_name = tmp_mkstemp(suffix=".png")
-                                    os.close(tmp_fd)
-                                    tmp_fd = None
-                                    pil_image.save(tmp_name, "PNG")
-                                    doc.add_picture(tmp_name, width=Inches(6))
-                                except Exception:
-                                    pass
-                                finally:
-                                    if tmp_fd is not None:
-                                        try:
-                                            os.close(tmp_fd)
-                                        except Exception:
-                                            pass
-                                    if tmp_name and os_path.exists(tmp_name):
-                                        try:
-                                            os.remove(tmp_name)
-                                        except Exception:
-                                            pass
-                            pdf.close()
-                        except Exception:
-                            pass  # Continue without images if conversion fails
+            pdf = pdfium.PdfDocument(input_path)
+            try:
+                total_pages = len(pdf)
+                progress_scale = 100.0 / total_pages if total_pages else 0.0
+                image_width = Inches(6)
+
+                # Extract/render in worker processes for large documents; docx assembly
+                # stays on this thread and consumes pages in order
+                workers = min(os.cpu_count() or 1, PARALLEL_WORD_MAX_WORKERS)
+                if workers > 1 and total_pages >= PARALLEL_WORD_MIN_PAGES:
+                    page_contents = self._iter_page_contents_parallel(input_path, total_pages, workers, include_images)
+                else:
+                    page_contents = _iter_page_contents(pdf, 0, total_pages, include_images)
+
+                try:
+                    for page_num, (text, image_bytes) in enumerate(page_contents):
+                        self.update_progress(int((page_num + 1) * progress_scale))
+                        if self._cancel_event.is_set():
+                            return False, self.language_manager.get(
+                                "op_word_cancelled", "Operation cancelled"
+                            ) if self.language_manager else "Operation cancelled"
+
+                        # Add page content to document
+                        doc.add_heading(f"Page {page_num + 1}", level=1)
+                        if text.strip():
+                            doc.add_paragraph(text)
+                        else:
+                            doc.add_paragraph("[No text content detected on this page]")
+
+                        if image_bytes:
+                            try:
+                                doc.add_picture(BytesIO(image_bytes), width=image_width)
+                            except Exception:
+                                pass
+                finally:
+                    page_contents.close()
+            finally:
+                pdf.close()
 
             # Save Word document atomically
             def _save_docx(tmp_path):
@@ -155,3 +224,32 @@ class PDFToWordConverter:
                 else "PDF to Word conversion failed: {error}"
             )
             return False, error_msg.format(error=str(e))
+
+    def _iter_page_contents_parallel(
+        self, input_path: str, total_pages: int, workers: int, include_images: bool = True
+    ):
+        """
+        Yield page text and images in page order, extracted by a process pool in contiguous page chunks
+
+        Args:
+            input_path: Path to input PDF file
+            total_pages: Number of pages in the document
+            workers: Number of worker processes
+            include_images: Render page images in the workers
+
+        Yields:
+            Tuple of (page text, PNG bytes or None)
+        """
+        # Several chunks per worker keeps the ordered stream flowing
+        chunk_size = max(1, -(-total_pages // (workers * 4)))
+        starts = range(0, total_pages, chunk_size)
+        stops = [min(start + chunk_size, total_pages) for start in starts]
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for contents in executor.map(
+                _extract_page_contents, repeat(input_path), starts, stops, repeat(include_images)
+            ):
+                yield from contents
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -3,29 +3,102 @@ PDF to JPEG Conversion Module for SafePDF
 Handles PDF to JPEG/JPG image conversion operations
 """
 
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from os import path as os_path
-from typing import Tuple
+from typing import Iterator, Tuple
 
 import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 from PIL import Image
 
 from SafePDF.logger.logging_config import get_logger
 
+# Documents with at least this many pages are rendered in a process pool
+# (pdfium is not thread-safe); below it the pool start-up cost outweighs the gain
+PARALLEL_JPG_MIN_PAGES = 8
+PARALLEL_JPG_MAX_WORKERS = 4
+
+# Rendered pages allowed to wait for the JPEG encoder thread; bounds memory
+# to a few page bitmaps while rendering runs ahead of encoding
+JPG_ENCODE_BACKLOG = 2
+
+
+def _render_page(pdf, page_num: int, scale: float):
+    """Render one page to a PIL image"""
+    # RGBX (reversed byte order) lets to_pil() share pdfium's buffer; the default BGR render is copied and swizzled
+    return pdf[page_num].render(scale=scale, force_bitmap_format=pdfium_c.FPDFBitmap_BGRx, rev_byteorder=True).to_pil()
+
+
+def _save_jpg(pil_image, output_path: str):
+    """Encode a rendered page to a JPG file"""
+    pil_image.save(output_path, "JPEG", quality=95, optimize=True)
+
+
+def _iter_pages_to_jpg(pdf, output_dir: str, scale: float, start: int, stop: int) -> Iterator[int]:
+    """
+    Render pages [start, stop) to JPG files, yielding 1 after each page
+
+    pdfium is not thread-safe, so pages are rendered here while a helper thread
+    encodes the previous ones; both release the GIL and overlap.
+    """
+    pending = deque()
+    encoder = ThreadPoolExecutor(max_workers=1)
+    try:
+        for page_num in range(start, stop):
+            output_path = os_path.join(output_dir, f"page_{page_num + 1}.jpg")
+            pending.append(encoder.submit(_save_jpg, _render_page(pdf, page_num, scale), output_path))
+            if len(pending) > JPG_ENCODE_BACKLOG:
+                pending.popleft().result()
+                yield 1
+        while pending:
+            pending.popleft().result()
+            yield 1
+    finally:
+        encoder.shutdown(cancel_futures=True)
+
+
+def _render_pages_to_jpg(input_path: str, output_dir: str, scale: float, start: int, stop: int) -> int:
+    """
+    Render pages [start, stop) to JPG files in a worker process
+
+    Args:
+        input_path: Path to input PDF file
+        output_dir: Directory to save JPG files
+        scale: Render scale (DPI / 72)
+        start: Index of the first page
+        stop: Index one past the last page
+
+    Returns:
+        Number of pages written
+    """
+    pdf = pdfium.PdfDocument(input_path)
+    try:
+        for _ in _iter_pages_to_jpg(pdf, output_dir, scale, start, stop):
+            pass
+    finally:
+        pdf.close()
+    return stop - start
+
 
 class PDFToJPEGConverter:
     """Class handling PDF to JPEG conversion operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None):
+    def __init__(self, progress_callback=None, language_manager=None, cancel_event=None):
         """
         Initialize PDF to JPEG converter
 
         Args:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDF2JPEG")
 
     def update_progress(self, value):
@@ -35,7 +108,7 @@ class PDFToJPEGConverter:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def pdf_to_jpg(self, input_path: str, output_dir: str, dpi: int = 200) -> Tuple[bool, str]:
         """
@@ -79,25 +152,27 @@ class PDFToJPEGConverter:
             # Calculate scale from DPI (72 DPI is default)
             scale = dpi / 72.0
 
-            for page_num in range(total_pages):
-                if self._cancel_requested:
-                    pdf.close()
-                    return False, self.language_manager.get(
-                        "op_cancelled", "Operation cancelled by user"
-                    ) if self.language_manager else "Operation cancelled by user"
-
-                # Render page to PIL Image
-                page = pdf[page_num]
-                pil_image = page.render(scale=scale).to_pil()
+            # Render in worker processes for large documents; each worker opens its own document
+            workers = min(os.cpu_count() or 1, PARALLEL_JPG_MAX_WORKERS)
+            if workers > 1 and total_pages >= PARALLEL_JPG_MIN_PAGES:
+                pages_written = self._iter_pages_to_jpg_parallel(input_path, output_dir, scale, total_pages, workers)
+            else:
+                pages_written = _iter_pages_to_jpg(pdf, output_dir, scale, 0, total_pages)
 
-                # Save as JPG
-                output_filename = f"page_{page_num + 1}.jpg"
-                output_path = os_path.join(output_dir, output_filename)
-                pil_image.save(output_path, "JPEG", quality=95, optimize=True)
-
-                self.update_progress(20 + (70 * page_num // total_pages))
+            try:
+                done = 0
+                for written in pages_written:
+                    if self._cancel_event.is_set():
+                        return False, self.language_manager.get(
+                            "op_cancelled", "Operation cancelled by user"
+                        ) if self.language_manager else "Operation cancelled by user"
+
+                    done += written
+                    self.update_progress(20 + (70 * done // total_pages))
+            finally:
+                pages_written.close()
+                pdf.close()
 
-            pdf.close()
             self.update_progress(100)
 
             success_msg = (
@@ -114,3 +189,32 @@ class PDFToJPEGConverter:
                 else "PDF to JPG conversion failed: {error}"
             )
             return False, error_msg.format(error=str(e))
+
+    def _iter_pages_to_jpg_parallel(
+        self, input_path: str, output_dir: str, scale: float, total_pages: int, workers: int
+    ):
+        """
+        Render pages to JPG files in a process pool, in contiguous page chunks
+
+        Args:
+            input_path: Path to input PDF file
+            output_dir: Directory to save JPG files
+            scale: Render scale (DPI / 72)
+            total_pages: Number of pages in the document
+            workers: Number of worker processes
+
+        Yields:
+            Number of pages written by each finished chunk, in page order
+        """
+        # Several chunks per worker keeps progress updates flowing
+        chunk_size = max(1, -(-total_pages // (workers * 4)))
+        starts = range(0, total_pages, chunk_size)
+        stops = [min(start + chunk_size, total_pages) for start in starts]
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(
+                _render_pages_to_jpg, repeat(input_path), repeat(output_dir), repeat(scale), starts, stops
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -3,23 +3,152 @@ PDF Compression Module for SafePDF
 Handles all PDF compression operations
 """
 
-import tkinter as tk
-from os import path as os_path
+import os
+import re
+import threading
+import zlib
+from io import BytesIO
 from pathlib import Path
-from tkinter import Button, Label, Toplevel, messagebox
 from typing import Tuple
 
-from PIL import Image, ImageTk
 from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, EncodedStreamObject, NameObject
+
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
 
 from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.pdf_io import map_file
 from SafePDF.ui.common_elements import CommonElements
 
+try:
+    import tkinter as tk
+    from tkinter import Button, Label, Toplevel, messagebox
+except ImportError:
+    messagebox = Toplevel = Label = Button = tk = None
+
+try:
+    from PIL import Image, ImageSequence, ImageTk
+except ImportError:
+    Image = ImageSequence = ImageTk = None
+
+# zlib level used when re-encoding page content streams, per UI quality preset;
+# "high" and "ultra" only fall back to this when pikepdf is unavailable
+COMPRESSION_PRESETS = {
+    "low": 9,
+    "medium": 6,
+    "high": 3,
+    "ultra": 9,
+}
+
+# /Producer values of optimizers whose output the PyPDF2 rewrite would only make larger
+_OPTIMIZER_PRODUCER_RE = re.compile(r"ghostscript|qpdf|pdf24", re.IGNORECASE)
+
+# Decoded PIL frames of the compression-error GIF, loaded once per process.
+# PhotoImage objects are bound to the Tk interpreter, so only the raw frames are cached
+_COMPRESSION_GIF_FRAMES = None
+
+
+def _make_page_compressor(compress_level: int):
+    """
+    Build a page compressor with the zlib level already bound
+
+    Args:
+        compress_level: zlib compression level (0-9)
+
+    Returns:
+        Function taking a page object and replacing its content streams with
+        a single FlateDecode stream
+    """
+
+    def _compress_page(page):
+        if "/Contents" not in page:
+            return
+        # Only the decoded bytes are needed; page.get_contents() would parse them into
+        # operators (a ContentStream) and serialize them again, which dominated the run time
+        content = page["/Contents"]
+        if isinstance(content, ArrayObject):
+            # A content array is one stream split at token boundaries
+            data = b"\n".join(stream.get_object().get_data() for stream in content)
+        else:
+            data = content.get_data()
+        encoded = EncodedStreamObject()
+        encoded[NameObject("/Filter")] = NameObject("/FlateDecode")
+        encoded._data = zlib.compress(data, compress_level)
+        page[NameObject("/Contents")] = encoded
+
+    return _compress_page
+
+
+def _is_already_optimized(file_path: str) -> bool:
+    """
+    Check whether a PDF was already optimized, so recompressing it cannot help
+
+    A linearized (fast web view) file or one written by a known optimizer already
+    has compressed object streams, which PyPDF2 writes back out uncompressed.
+    Only the trailer and document info are read; pages are not loaded.
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        True if the file is linearized or its producer is a known optimizer; False
+        otherwise, including when the file cannot be opened (reported by the caller's checks)
+    """
+    try:
+        with pikepdf.open(file_path) as pdf:
+            if pdf.is_linearized:
+                return True
+            info = pdf.trailer.get("/Info")
+            producer = str(info.get("/Producer", "")) if info is not None else ""
+            return _OPTIMIZER_PRODUCER_RE.search(producer) is not None
+    except Exception:
+        return False
+
+
+def _decode_gif_frames(gif_path) -> list:
+    """
+    Decode every frame of a GIF into standalone PIL images
+
+    Args:
+        gif_path: Path to the GIF file
+
+    Returns:
+        List of PIL images, one per frame
+    """
+    with Image.open(gif_path) as gif_image:
+        return [frame.copy() for frame in ImageSequence.Iterator(gif_image)]
+
+
+def _load_compression_gif_frames(gif_path) -> list:
+    """
+    Return the compression-error GIF frames, decoding them on first use only
+
+    Args:
+        gif_path: Path to the GIF file
+
+    Returns:
+        List of PIL images, one per frame
+    """
+    global _COMPRESSION_GIF_FRAMES
+    if _COMPRESSION_GIF_FRAMES is None:
+        _COMPRESSION_GIF_FRAMES = _decode_gif_frames(gif_path)
+    return _COMPRESSION_GIF_FRAMES
+
 
 class PDFCompressor:
     """Class handling PDF compression operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None, validate_pdf=None):
+    def __init__(
+        self,
+        progress_callback=None,
+        language_manager=None,
+        atomic_write_file=None,
+        validate_pdf=None,
+        cancel_event=None,
+    ):
         """
         Initialize PDF compressor
 
@@ -27,13 +156,15 @@ class PDFCompressor:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
             atomic_write_file: Function for atomic file writing
-            validate_pdf: Function to validate PDF files
+            validate_pdf: Function to validate PDF files, taking a quick keyword
+                (False forces a full parse)
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
         self._atomic_write_file = atomic_write_file
         self._validate_pdf = validate_pdf
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDFCompress")
 
     def update_progress(self, value):
@@ -43,7 +174,7 @@ class PDFCompressor:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def compress_pdf(self, input_path: str, output_path: str, quality: str = "medium") -> Tuple[bool, str]:
         """
@@ -52,7 +183,34 @@ class PDFCompressor:
         Args:
             input_path: Input PDF file path
             output_path: Output PDF file path
-            quality: Compression quality ("low", "medium", "high")
+            quality: Compression quality ("low", "medium", "high", "ultra")
+
+        Returns:
+            Tuple of (success, message)
+        """
+        # "high" and "ultra" are lossless; already optimized files would only grow through the
+        # PyPDF2 rewrite, so they get the lossless structural rewrite (content streams kept) too
+        if pikepdf and quality in ("high", "ultra"):
+            return self._compress_pdf_impl(input_path, output_path, quality, None)
+        if pikepdf and _is_already_optimized(input_path):
+            return self._compress_pdf_impl(input_path, output_path, quality, None, already_optimized=True)
+        compress_level = COMPRESSION_PRESETS.get(quality, COMPRESSION_PRESETS["medium"])
+        return self._compress_pdf_impl(input_path, output_path, quality, _make_page_compressor(compress_level))
+
+    def _compress_pdf_impl(
+        self, input_path: str, output_path: str, quality: str, compress_page, already_optimized: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        Compress PDF file with preset-specific settings already resolved
+
+        Args:
+            input_path: Input PDF file path
+            output_path: Output PDF file path
+            quality: Compression quality name (used for the result message)
+            compress_page: Page compressor built by _make_page_compressor, or None to
+                only rewrite the file structure with pikepdf (see _save_lossless)
+            already_optimized: The lossless rewrite replaced the requested preset because the
+                input was already optimized; the result message says so
 
         Returns:
             Tuple of (success, message)
@@ -65,8 +223,10 @@ class PDFCompressor:
 
             self.update_progress(5)
 
-            # Validate input file
-            if not os_path.exists(input_path):
+            # Validate input file; its size is the baseline for the result
+            try:
+                original_size = os.stat(input_path).st_size
+            except OSError:
                 return False, self.language_manager.get(
                     "op_input_file_not_exist", "Input file does not exist"
                 ) if self.language_manager else "Input file does not exist"
@@ -76,49 +236,85 @@ class PDFCompressor:
                     "op_invalid_pdf", "Input file is not a valid PDF"
                 ) if self.language_manager else "Input file is not a valid PDF"
 
-            # Use PyPDF2 stream compression approach
             self.update_progress(10)
-            reader = PdfReader(input_path)
-            writer = PdfWriter()
-            total_pages = len(reader.pages)
-            for i, page in enumerate(reader.pages):
-                if self._cancel_requested:
-                    return False, self.language_manager.get(
-                        "op_cancelled", "Operation cancelled by user"
-                    ) if self.language_manager else "Operation cancelled by user"
-                try:
-                    page.compress_content_streams()
-                except Exception:
-                    pass
-                writer.add_page(page)
-                self.update_progress(10 + (80 * i // max(1, total_pages)))
-
-            def _write_compressed(tmpf):
-                writer.write(tmpf)
-
-            if self._atomic_write_file:
-                self._atomic_write_file(output_path, _write_compressed)
+            if compress_page is None:
+                self._save_lossless(input_path, output_path)
             else:
-                with open(output_path, "wb") as f:
-                    _write_compressed(f)
+                # Use PyPDF2 stream compression approach
+                # Keep the mapping open until the writer has serialized the pages it references
+                compressed = BytesIO()
+                with map_file(input_path) as mapped:
+                    reader = PdfReader(mapped)
+                    writer = PdfWriter()
+                    total_pages = len(reader.pages)
+                    cancel_is_set = self._cancel_event.is_set
+                    for i, page in enumerate(reader.pages):
+                        # Pages are cheap here, so only poll for cancellation every 4th one
+                        if (i & 3) == 0 and cancel_is_set():
+                            return False, self.language_manager.get(
+                                "op_cancelled", "Operation cancelled by user"
+                            ) if self.language_manager else "Operation cancelled by user"
+                        try:
+                            compress_page(page)
+                        except Exception:
+                            pass
+                        writer.add_page(page)
+                        self.update_progress(10 + (80 * i // max(1, total_pages)))
+                    writer.write(compressed)
+
+                # Write only after the mapping is closed: output_path may be the input itself,
+                # and Windows cannot replace a file that is still mapped
+                def _write_compressed(tmpf):
+                    tmpf.write(compressed.getbuffer())
+
+                if self._atomic_write_file:
+                    self._atomic_write_file(output_path, _write_compressed)
+                else:
+                    with open(output_path, "wb") as f:
+                        _write_compressed(f)
 
             self.update_progress(100)
 
             # Compare sizes and warn if increased
-            if os_path.exists(output_path):
-                if self._validate_pdf and not self._validate_pdf(output_path):
+            try:
+                compressed_size = os.stat(output_path).st_size
+            except OSError:
+                compressed_size = None
+            if compressed_size is not None:
+                # Freshly written output gets the full parse; the quick marker check would pass a truncated file
+                if self._validate_pdf and not self._validate_pdf(output_path, quick=False):
                     return False, self.language_manager.get(
                         "op_invalid_output", "Compression completed but output file is invalid"
                     ) if self.language_manager else "Compression completed but output file is invalid"
 
-                original_size = os_path.getsize(input_path)
-                compressed_size = os_path.getsize(output_path)
                 if original_size == 0:
                     return False, self.language_manager.get(
                         "op_zero_size", "Original file size is zero. Cannot calculate compression."
                     ) if self.language_manager else "Original file size is zero. Cannot calculate compression."
+                if already_optimized and compressed_size >= original_size:
+                    return (
+                        False,
+                        self.language_manager.get(
+                            "op_already_optimized",
+                            "The PDF is already optimized; no further size reduction is possible.",
+                        )
+                        if self.language_manager
+                        else "The PDF is already optimized; no further size reduction is possible.",
+                    )
                 if compressed_size < original_size:
                     compression_ratio = (1 - (compressed_size / original_size)) * 100
+                    if already_optimized:
+                        success_msg = (
+                            self.language_manager.get(
+                                "op_compress_already_optimized",
+                                "The PDF is already optimized, so it was rewritten losslessly instead of with "
+                                "quality {quality}. Size reduced by {compression_ratio:.1f}%",
+                            )
+                            if self.language_manager
+                            else "The PDF is already optimized, so it was rewritten losslessly instead of with "
+                            "quality {quality}. Size reduced by {compression_ratio:.1f}%"
+                        )
+                        return True, success_msg.format(quality=quality, compression_ratio=compression_ratio)
                     success_msg = (
                         self.language_manager.get(
                             "op_compress_success",
@@ -165,6 +361,29 @@ class PDFCompressor:
             )
             return False, error_msg.format(error=str(e))
 
+    def _save_lossless(self, input_path: str, output_path: str):
+        """
+        Rewrite a PDF losslessly with pikepdf (qpdf)
+
+        qpdf writes only the objects still referenced, compresses any unfiltered
+        streams and packs the remaining objects into compressed object streams,
+        which is smaller and much faster than re-deflating every page in Python.
+
+        Args:
+            input_path: Input PDF file path
+            output_path: Output PDF file path
+        """
+        with pikepdf.open(input_path) as pdf:
+
+            def _write_lossless(tmpf):
+                pdf.save(tmpf, compress_streams=True, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+
+            if self._atomic_write_file:
+                self._atomic_write_file(output_path, _write_lossless)
+            else:
+                with open(output_path, "wb") as f:
+                    _write_lossless(f)
+
     def show_compression_error_popup(self):
         """
         Show a custom popup with compression error gif when no compression is achieved
@@ -189,44 +408,60 @@ class PDFCompressor:
             popup.transient()
             popup.grab_set()
 
-            # Load and display the gif using package-relative path
-            module_dir = Path(__file__).parent
-            gif_path = module_dir / "assets" / "compression_err.gif"
+            # Load and display the gif from the package assets directory
+            gif_path = Path(__file__).parent.parent / "assets" / "compression_err.gif"
             if gif_path.exists():
-                try:
-                    # Load the GIF and handle animation
-                    gif_image = Image.open(str(gif_path))
-                    frames = []
+                img_label = Label(popup)
+                img_label.pack(pady=10)
+
+                # Decode the GIF in a background thread so the popup shows immediately;
+                # PhotoImage objects must be created on the Tk thread once frames are ready
+                # (frames cached by an earlier popup are used without a thread)
+                decoded = {"frames": _COMPRESSION_GIF_FRAMES} if _COMPRESSION_GIF_FRAMES is not None else {}
 
+                def decode_gif():
                     try:
-                        # Extract all frames from the GIF
-                        while True:
-                            frames.append(ImageTk.PhotoImage(gif_image.copy()))
-                            gif_image.seek(gif_image.tell() + 1)
-                    except EOFError:
-                        pass  # End of frames
-
-                    # Display animated GIF
-                    img_label = Label(popup)
-                    img_label.pack(pady=10)
-
-                    def animate_gif(frame_index=0):
-                        if frames:
-                            img_label.config(image=frames[frame_index])
-                            popup.after(100, animate_gif, (frame_index + 1) % len(frames))
-
-                    animate_gif()
-
-                except Exception:
-                    # If gif loading fails, show text instead
-                    Label(
-                        popup,
-                        text=self.language_manager.get("op_compression_info", "Compression Info")
-                        if self.language_manager
-                        else "Compression Info",
-                        font=(CommonElements.FONT, 16, "bold"),
-                    ).pack(pady=10)
-                    self.logger.error("Error loading compression error GIF", exc_info=True)
+                        decoded["frames"] = _load_compression_gif_frames(gif_path)
+                    except Exception:
+                        self.logger.error("Error loading compression error GIF", exc_info=True)
+
+                loader = threading.Thread(target=decode_gif, daemon=True)
+                if not decoded:
+                    loader.start()
+
+                animation = {}
+
+                def animate_gif(frames, frame_index=0):
+                    if popup.winfo_exists():
+                        img_label.config(image=frames[frame_index])
+                        animation["after_id"] = popup.after(100, animate_gif, frames, (frame_index + 1) % len(frames))
+
+                def stop_animation(event):
+                    # Cancel the pending frame so the timer (and its PhotoImages) dies with the popup
+                    if event.widget is popup and "after_id" in animation:
+                        popup.after_cancel(animation.pop("after_id"))
+
+                popup.bind("<Destroy>", stop_animation, add="+")
+
+                def install_frames():
+                    if loader.is_alive():
+                        popup.after(20, install_frames)
+                        return
+                    if not popup.winfo_exists():
+                        return
+                    frames = [ImageTk.PhotoImage(frame) for frame in decoded.get("frames", ())]
+                    if frames:
+                        animate_gif(frames)
+                    else:
+                        # If gif loading fails, show text instead
+                        img_label.config(
+                            text=self.language_manager.get("op_compression_info", "Compression Info")
+                            if self.language_manager
+                            else "Compression Info",
+                            font=(CommonElements.FONT, 16, "bold"),
+                        )
+
+                popup.after(0, install_frames)
             else:
                 # If gif file doesn't exist, show icon
                 Label(
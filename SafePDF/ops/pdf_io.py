@@ -0,0 +1,46 @@
+"""
+PDF Input Helpers for SafePDF
+Shared read-side helpers for the PDF operation modules
+"""
+
+import mmap
+import re
+
+# Any CR/CRLF line break, and PDFium's U+FFFE soft-hyphen marker with the line break after it
+_LINE_BREAK_RE = re.compile("\r\n?")
+_SOFT_HYPHEN_RE = re.compile("\ufffe\n?")
+
+
+def map_file(input_path: str) -> mmap.mmap:
+    """
+    Map a file read-only so PdfReader walks it in memory instead of issuing many small reads
+
+    Args:
+        input_path: Path to the file
+
+    Returns:
+        Read-only memory map; the file handle itself is already closed
+    """
+    with open(input_path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def pdfium_page_text(pdf, index: int) -> str:
+    """
+    Extract the text of a single page with pypdfium2
+
+    Args:
+        pdf: Open pypdfium2 PdfDocument
+        index: Zero-based page index
+
+    Returns:
+        Page text with "\n" line endings and hyphenated words rejoined
+    """
+    page = pdf[index]
+    textpage = page.get_textpage()
+    try:
+        text = _LINE_BREAK_RE.sub("\n", textpage.get_text_range())
+        return _SOFT_HYPHEN_RE.sub("", text)
+    finally:
+        textpage.close()
+        page.close()
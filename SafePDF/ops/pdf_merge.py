@@ -3,6 +3,8 @@ PDF Merge Module for SafePDF
 Handles PDF merging operations
 """
 
+import threading
+from contextlib import ExitStack
 from typing import List, Tuple
 
 try:
@@ -10,13 +12,19 @@ try:
 except ImportError:
     PdfReader = PdfWriter = None
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
 from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.pdf_io import map_file
 
 
 class PDFMerger:
     """Class handling PDF merge operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None):
+    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None, cancel_event=None):
         """
         Initialize PDF merger
 
@@ -24,11 +32,12 @@ class PDFMerger:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
             atomic_write_file: Function for atomic file writing
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
         self._atomic_write_file = atomic_write_file
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDFMerge")
 
     def update_progress(self, value):
@@ -38,7 +47,7 @@ class PDFMerger:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def merge_pdfs(self, input_paths: List[str], output_path: str) -> Tuple[bool, str]:
         """
@@ -52,7 +61,7 @@ class PDFMerger:
             Tuple of (success, message)
         """
         try:
-            if not PdfReader or not PdfWriter:
+            if not pikepdf and (not PdfReader or not PdfWriter):
                 return False, (
                     self.language_manager.get("op_pypdf_unavailable", "PyPDF2/pypdf not available")
                     if self.language_manager
@@ -61,18 +70,27 @@ class PDFMerger:
 
             self.update_progress(10)
 
-            writer = PdfWriter()
             total_files = len(input_paths)
+            if pikepdf:
+                if not self._merge_pikepdf(input_paths, output_path):
+                    return False, (
+                        self.language_manager.get("op_cancelled", "Operation cancelled by user")
+                        if self.language_manager
+                        else "Operation cancelled by user"
+                    )
+                return self._merge_success(total_files)
+
+            writer = PdfWriter()
 
             for i, input_path in enumerate(input_paths):
-                if self._cancel_requested:
+                if self._cancel_event.is_set():
                     return False, (
                         self.language_manager.get("op_cancelled", "Operation cancelled by user")
                         if self.language_manager
                         else "Operation cancelled by user"
                     )
-                with open(input_path, "rb") as input_file:
-                    reader = PdfReader(input_file)
+                with map_file(input_path) as mapped:
+                    reader = PdfReader(mapped)
                     for page in reader.pages:
                         writer.add_page(page)
 
@@ -87,13 +105,7 @@ class PDFMerger:
                 with open(output_path, "wb") as f:
                     _write_merged(f)
 
-            self.update_progress(100)
-            success_msg = (
-                self.language_manager.get("op_merge_success", "Successfully merged {total_files} PDF files")
-                if self.language_manager
-                else "Successfully merged {total_files} PDF files"
-            )
-            return True, success_msg.format(total_files=total_files)
+            return self._merge_success(total_files)
 
         except Exception as e:
             error_msg = (
@@ -102,3 +114,46 @@ class PDFMerger:
                 else "Merge failed: {error}"
             )
             return False, error_msg.format(error=str(e))
+
+    def _merge_pikepdf(self, input_paths: List[str], output_path: str) -> bool:
+        """
+        Merge PDF files with pikepdf (qpdf)
+
+        qpdf copies the page objects natively and streams their data from the open
+        source files while saving, instead of cloning every page tree in Python first.
+
+        Args:
+            input_paths: List of input PDF file paths
+            output_path: Output merged PDF file path
+
+        Returns:
+            True if merged, False if cancelled
+        """
+        total_files = len(input_paths)
+        # Sources must stay open until the merged file is saved
+        with ExitStack() as stack:
+            merged = stack.enter_context(pikepdf.new())
+            for i, input_path in enumerate(input_paths):
+                if self._cancel_event.is_set():
+                    return False
+                source = stack.enter_context(pikepdf.open(input_path))
+                merged.pages.extend(source.pages)
+
+                self.update_progress(10 + (80 * i // total_files))
+
+            if self._atomic_write_file:
+                self._atomic_write_file(output_path, merged.save)
+            else:
+                with open(output_path, "wb") as f:
+                    merged.save(f)
+        return True
+
+    def _merge_success(self, total_files: int) -> Tuple[bool, str]:
+        """Report a completed merge"""
+        self.update_progress(100)
+        success_msg = (
+            self.language_manager.get("op_merge_success", "Successfully merged {total_files} PDF files")
+            if self.language_manager
+            else "Successfully merged {total_files} PDF files"
+        )
+        return True, success_msg.format(total_files=total_files)
@@ -4,14 +4,21 @@ Implements various PDF manipulation operations using PyPDF2/pypdf and Pillow
 """
 
 import os
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
 from os import path as os_path
 from tempfile import mkstemp as tmp_mkstemp
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from SafePDF.logger.logging_config import get_logger
 from SafePDF.ops.pdf2docx import PDFToWordConverter
 from SafePDF.ops.pdf2jpeg import PDFToJPEGConverter
 from SafePDF.ops.pdf_compress import PDFCompressor
+from SafePDF.ops.pdf_io import map_file, pdfium_page_text
 from SafePDF.ops.pdf_merge import PDFMerger
 from SafePDF.ops.pdf_rotate import PDFRotator
 from SafePDF.ops.pdf_split import PDFSplitter
@@ -41,22 +48,157 @@ except ImportError:
     print("Warning: pypdfium2 not installed. PDF to image conversion will not work.")
     pdfium = None
 
+# Documents with at least this many pages have their text extracted in a
+# process pool; below it the pool start-up cost outweighs the gain
+PARALLEL_TEXT_MIN_PAGES = 64
+PARALLEL_TEXT_MAX_WORKERS = 4
+
+# Buffer size for atomic temp-file writes; PyPDF2 serializes in many small
+# writes, which the default 8 KiB buffer turns into many write() syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum seconds between forwarded progress updates; every update repaints
+# the progress bar on the UI thread, which slows down fast page loops
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Default (English) texts of the messages PDFOperations returns itself;
+# localized through the language manager by PDFOperations._msg
+_OP_MESSAGES = {
+    "op_pypdf_unavailable": "PyPDF2/pypdf not available",
+    "op_cancelled": "Operation cancelled by user",
+    "op_word_cancelled": "Operation cancelled",
+    "op_repair_success": "PDF repaired. Recovered {pages_recovered} pages",
+    "op_repair_intact": "PDF has no structural errors; copied without changes",
+    "op_repair_no_pages": "Could not recover any pages from the PDF",
+    "op_repair_failed": "Repair failed: {error}",
+    "op_text_success": "Text extracted to {output_path}",
+    "op_text_failed": "Text extraction failed: {error}",
+    "op_hidden_success": "Hidden information extracted to {output_path}",
+    "op_hidden_failed": "Hidden info extraction failed: {error}",
+}
+
+
+def _has_pdf_markers(file_path: str) -> bool:
+    """
+    Check for the %PDF- header and %%EOF trailer without parsing the file
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        True if both markers are present
+    """
+    with open(file_path, "rb") as file:
+        if not file.read(1024).startswith(b"%PDF-"):
+            return False
+        file.seek(0, os.SEEK_END)
+        file.seek(max(0, file.tell() - 1024))
+        return b"%%EOF" in file.read()
+
+
+def _page_count(reader) -> int:
+    """
+    Read the page count from the root /Pages node
+
+    len(reader.pages) makes PyPDF2 flatten the whole page tree, which dominates
+    the cost of get_pdf_info on large documents; /Count is already the total.
+
+    Args:
+        reader: Open PdfReader
+
+    Returns:
+        Number of pages, falling back to the flattened tree if /Count is unusable
+    """
+    try:
+        count = reader.trailer["/Root"]["/Pages"]["/Count"]
+        if isinstance(count, int) and count >= 0:
+            return int(count)
+    except Exception:
+        pass
+    return len(reader.pages)
+
+
+def _parses_strictly(file_path: str) -> bool:
+    """
+    Check whether PyPDF2 can read the page tree in strict mode, i.e. without
+    its lenient xref recovery
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        True if the file needs no repair
+    """
+    try:
+        with map_file(file_path) as mapped:
+            len(PdfReader(mapped, strict=True).pages)
+        return True
+    except Exception:
+        return False
+
+
+def _extract_page_texts(input_path: str, start: int, stop: int) -> List[bytes]:
+    """
+    Extract the UTF-8 encoded text of pages [start, stop) in a worker process
+
+    Args:
+        input_path: Path to input PDF file
+        start: First page index (inclusive)
+        stop: Last page index (exclusive)
+
+    Returns:
+        List of UTF-8 encoded page texts
+    """
+    if pdfium:
+        pdf = pdfium.PdfDocument(input_path)
+        try:
+            return [pdfium_page_text(pdf, i).encode("utf-8") for i in range(start, stop)]
+        finally:
+            pdf.close()
+
+    with map_file(input_path) as mapped:
+        pages = PdfReader(mapped).pages
+        return [pages[i].extract_text().encode("utf-8") for i in range(start, stop)]
+
+
+class OperationCancelled(Exception):
+    """Raised from a write callback to abort an atomic write on user cancellation"""
+
 
 class PDFOperations:
     """Class containing all PDF manipulation operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None):
+    def __init__(self, progress_callback=None, language_manager=None, atomic_durable=False):
         """
         Initialize PDF operations handler
 
         Args:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
+            atomic_durable: fsync temp files before the atomic rename by default
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
-        # Cancellation flag that can be set by controller/UI
-        self._cancel_requested = False
+        # Localized _OP_MESSAGES, rebuilt when the UI switches language
+        self._msgs = _OP_MESSAGES
+        self._msgs_lang = None
+        # The rename alone is atomic; fsync (a full disk flush) is opt-in
+        self.atomic_durable = atomic_durable
+        # Cancellation event that can be set by controller/UI; shared with the
+        # delegate handlers so a request reaches an operation already running
+        self._cancel_event = threading.Event()
+        # Parsed reader of the most recent input, keyed by (path, mtime, size). get_pdf_info
+        # runs on the Tk thread and extract_hidden_info on the worker; PdfReader resolves
+        # objects lazily from one shared stream, so the lock is held while a reader is used
+        self._reader_cache = {}
+        self._reader_lock = threading.Lock()
+        # Last forwarded progress value and when it was sent, plus a value held back by the
+        # interval and the timer that sends it (see update_progress)
+        self._last_progress = -1
+        self._last_progress_time = 0.0
+        self._pending_progress = None
+        self._progress_timer = None
+        self._progress_lock = threading.Lock()
 
         # Module logger
         self.logger = get_logger("SafePDF.PDFOps")
@@ -67,11 +209,14 @@ class PDFOperations:
             language_manager=self.language_manager,
             atomic_write_file=self._atomic_write_file,
             validate_pdf=self.validate_pdf,
+            cancel_event=self._cancel_event,
         )
 
         # Initialize PDF to JPEG converter
         self.jpeg_converter = PDFToJPEGConverter(
-            progress_callback=self.update_progress, language_manager=self.language_manager
+            progress_callback=self.update_progress,
+            language_manager=self.language_manager,
+            cancel_event=self._cancel_event,
         )
 
         # Initialize PDF to Word converter
@@ -79,6 +224,7 @@ class PDFOperations:
             progress_callback=self.update_progress,
             language_manager=self.language_manager,
             atomic_write_via_path=self._atomic_write_via_path,
+            cancel_event=self._cancel_event,
         )
 
         # Initialize PDF splitter
@@ -86,6 +232,7 @@ class PDFOperations:
             progress_callback=self.update_progress,
             language_manager=self.language_manager,
             atomic_write_file=self._atomic_write_file,
+            cancel_event=self._cancel_event,
         )
 
         # Initialize PDF merger
@@ -93,6 +240,7 @@ class PDFOperations:
             progress_callback=self.update_progress,
             language_manager=self.language_manager,
             atomic_write_file=self._atomic_write_file,
+            cancel_event=self._cancel_event,
         )
 
         # Initialize PDF rotator
@@ -100,6 +248,7 @@ class PDFOperations:
             progress_callback=self.update_progress,
             language_manager=self.language_manager,
             atomic_write_file=self._atomic_write_file,
+            cancel_event=self._cancel_event,
         )
 
     def _ensure_parent_dir(self, file_path: str):
@@ -116,12 +265,15 @@ class PDFOperations:
             self.logger.error(f"Failed to create parent directory for {file_path}", exc_info=True)
             pass
 
-    def _atomic_write_file(self, final_path: str, write_func):
+    def _atomic_write_file(self, final_path: str, write_func, durable: Optional[bool] = None):
         """
         Atomically write to `final_path` using a temp file in the same directory.
         `write_func` is called with an open file object (binary mode) to write content.
         Uses os.replace for atomic move and ensures cleanup on errors.
+        The temp file is fsynced first only if `durable` (default: self.atomic_durable).
         """
+        if durable is None:
+            durable = self.atomic_durable
         parent = os_path.dirname(final_path) or os.getcwd()
         self._ensure_parent_dir(final_path)
 
@@ -134,19 +286,22 @@ class PDFOperations:
             )
 
             # Write content via callback
-            with os.fdopen(fd, "wb") as tmpf:
+            with os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE) as tmpf:
                 fd = None  # fdopen takes ownership
                 write_func(tmpf)
-                tmpf.flush()
-                try:
-                    os.fsync(tmpf.fileno())
-                except (OSError, AttributeError):
-                    pass
+                if durable:
+                    tmpf.flush()
+                    try:
+                        os.fsync(tmpf.fileno())
+                    except (OSError, AttributeError):
+                        pass
 
             # Atomic replace
             os.replace(tmp_path, final_path)
             tmp_path = None  # Successfully moved
 
+        except OperationCancelled:
+            raise
         except Exception:
             self.logger.error(f"Error during atomic write to {final_path}", exc_info=True)
             raise
@@ -165,12 +320,15 @@ class PDFOperations:
                     self.logger.error("Error removing temporary file", exc_info=True)
                     pass
 
-    def _atomic_write_via_path(self, final_path: str, write_path_func):
+    def _atomic_write_via_path(self, final_path: str, write_path_func, durable: Optional[bool] = None):
         """
         Atomically write to `final_path` by providing a temp path to write_path_func.
         `write_path_func` is called with a temp file path (string) to write to.
         Uses os.replace for atomic move and ensures cleanup on errors.
+        The temp file is fsynced first only if `durable` (default: self.atomic_durable).
         """
+        if durable is None:
+            durable = self.atomic_durable
         parent = os_path.dirname(final_path) or os.getcwd()
         self._ensure_parent_dir(final_path)
 
@@ -186,6 +344,12 @@ class PDFOperations:
 
             # Let caller write to temp path
             write_path_func(tmp_path)
+            if durable:
+                with open(tmp_path, "rb") as written:
+                    try:
+                        os.fsync(written.fileno())
+                    except OSError:
+                        pass
 
             # Atomic replace
             os.replace(tmp_path, final_path)
@@ -206,21 +370,91 @@ class PDFOperations:
                 except Exception:
                     pass
 
+    def _msg(self, key: str) -> str:
+        """
+        Return the localized text of one of the _OP_MESSAGES
+
+        Args:
+            key: Message key, e.g. "op_text_success"
+
+        Returns:
+            Localized message, or the English default without a language manager
+        """
+        if self.language_manager:
+            lang = self.language_manager.lang
+            if lang != self._msgs_lang:
+                get = self.language_manager.get
+                self._msgs = {k: get(k, default) for k, default in _OP_MESSAGES.items()}
+                self._msgs_lang = lang
+        return self._msgs[key]
+
     def update_progress(self, value):
-        """Update progress if callback is available"""
-        if self.progress_callback:
-            self.progress_callback(value)
+        """
+        Forward integer-percentage changes to the callback, at most every PROGRESS_MIN_INTERVAL seconds
+
+        This is the only progress throttle; the operation loops report every step. A value
+        held back by the interval is sent by a timer when the interval ends, so the bar does
+        not stay on an old value through a long step. Completion (100) and a restart (a new
+        operation) are forwarded at once.
+        """
+        if not self.progress_callback:
+            return
+        value = int(value)
+        with self._progress_lock:
+            latest = self._last_progress if self._pending_progress is None else self._pending_progress
+            if value == latest:
+                return
+            wait = self._last_progress_time + PROGRESS_MIN_INTERVAL - time.monotonic()
+            if value >= 100 or value < latest or wait <= 0:
+                self._send_progress(value)
+            else:
+                if self._progress_timer is None:
+                    self._progress_timer = threading.Timer(wait, self._flush_progress)
+                    self._progress_timer.daemon = True
+                    self._progress_timer.start()
+                self._pending_progress = value
+
+    def _send_progress(self, value):
+        """Send a progress value to the callback and drop any held-back one; the caller holds _progress_lock"""
+        if self._progress_timer is not None:
+            self._progress_timer.cancel()
+            self._progress_timer = None
+        self._pending_progress = None
+        self._last_progress = value
+        self._last_progress_time = time.monotonic()
+        self.progress_callback(value)
+
+    def _flush_progress(self):
+        """Send the value held back by the interval (timer callback)"""
+        with self._progress_lock:
+            self._progress_timer = None
+            if self._pending_progress is not None:
+                self._send_progress(self._pending_progress)
+
+    def finish_progress(self):
+        """Drop a held-back progress value once an operation has returned, so it cannot overwrite the final state"""
+        with self._progress_lock:
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            self._pending_progress = None
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
+
+    def reset_cancel(self):
+        """Clear a previous cancellation request before starting a new operation."""
+        self._cancel_event.clear()
 
-    def validate_pdf(self, file_path: str) -> bool:
+    def validate_pdf(self, file_path: str, quick: bool = True) -> bool:
         """
         Validate if file is a valid PDF
 
         Args:
             file_path: Path to PDF file
+            quick: Accept the file on its %PDF- header and %%EOF trailer alone;
+                False always parses the page tree
 
         Returns:
             True if valid PDF, False otherwise
@@ -229,8 +463,13 @@ class PDFOperations:
             if not PdfReader:
                 return False
 
-            with open(file_path, "rb") as file:
-                reader = PdfReader(file)
+            # Files that fail the marker check still get a full parse, which
+            # tolerates leading junk and long trailing garbage
+            if quick and _has_pdf_markers(file_path):
+                return True
+
+            with map_file(file_path) as mapped:
+                reader = PdfReader(mapped)
                 # Try to access pages to ensure it's readable
                 len(reader.pages)
             return True
@@ -244,17 +483,15 @@ class PDFOperations:
         Args:
             input_path: Input PDF file path
             output_path: Output PDF file path
-            quality: Compression quality ("low", "medium", "high")
+            quality: Compression quality ("low", "medium", "high", "ultra")
 
         Returns:
             Tuple of (success, message)
         """
-        # Sync cancellation flag
-        self.compressor._cancel_requested = self._cancel_requested
         return self.compressor.compress_pdf(input_path, output_path, quality)
 
     def split_pdf(
-        self, input_path: str, output_dir: str, method: str = "pages", page_range: str = None
+        self, input_path: str, output_dir: str, method: str = "pages", page_range: str = None, chunk_size: int = 1
     ) -> Tuple[bool, str]:
         """
         Split PDF into multiple files (delegates to PDFSplitter)
@@ -264,13 +501,12 @@ class PDFOperations:
             output_dir: Directory to save split files
             method: Split method ("pages" for each page, "range" for specific range)
             page_range: Page range if method is "range" (e.g., "1-5,7,10-12")
+            chunk_size: Pages per output file if method is "pages"
 
         Returns:
             Tuple of (success, message)
         """
-        # Sync cancellation flag
-        self.splitter._cancel_requested = self._cancel_requested
-        return self.splitter.split_pdf(input_path, output_dir, method, page_range)
+        return self.splitter.split_pdf(input_path, output_dir, method, page_range, chunk_size)
 
     def merge_pdfs(self, input_paths: List[str], output_path: str) -> Tuple[bool, str]:
         """
@@ -283,8 +519,6 @@ class PDFOperations:
         Returns:
             Tuple of (success, message)
         """
-        # Sync cancellation flag
-        self.merger._cancel_requested = self._cancel_requested
         return self.merger.merge_pdfs(input_paths, output_path)
 
     def pdf_to_jpg(self, input_path: str, output_dir: str, dpi: int = 200) -> Tuple[bool, str]:
@@ -299,8 +533,6 @@ class PDFOperations:
         Returns:
             Tuple of (success, message)
         """
-        # Sync cancellation flag
-        self.jpeg_converter._cancel_requested = self._cancel_requested
         return self.jpeg_converter.pdf_to_jpg(input_path, output_dir, dpi)
 
     def rotate_pdf(self, input_path: str, output_path: str, angle: int = 90) -> Tuple[bool, str]:
@@ -315,8 +547,6 @@ class PDFOperations:
         Returns:
             Tuple of (success, message)
         """
-        # Sync cancellation flag
-        self.rotator._cancel_requested = self._cancel_requested
         return self.rotator.rotate_pdf(input_path, output_path, angle)
 
     def repair_pdf(self, input_path: str, output_path: str) -> Tuple[bool, str]:
@@ -332,14 +562,24 @@ class PDFOperations:
         """
         try:
             if not PdfReader or not PdfWriter:
-                return False, self.language_manager.get(
-                    "op_pypdf_unavailable", "PyPDF2/pypdf not available"
-                ) if self.language_manager else "PyPDF2/pypdf not available"
+                return False, self._msg("op_pypdf_unavailable")
 
             self.update_progress(10)
 
-            with open(input_path, "rb") as input_file:
-                reader = PdfReader(input_file, strict=False)  # Less strict parsing
+            # A file that parses strictly has nothing to repair; copy its bytes instead of rewriting it
+            if _parses_strictly(input_path):
+
+                def _copy_intact(tmpf):
+                    with open(input_path, "rb") as src:
+                        shutil.copyfileobj(src, tmpf, _WRITE_BUFFER_SIZE)
+
+                self._atomic_write_file(output_path, _copy_intact)
+                self.update_progress(100)
+                return True, self._msg("op_repair_intact")
+
+            repaired = BytesIO()
+            with map_file(input_path) as mapped:
+                reader = PdfReader(mapped, strict=False)  # Less strict parsing
                 writer = PdfWriter()
 
                 self.update_progress(30)
@@ -347,17 +587,20 @@ class PDFOperations:
                 pages_recovered = 0
                 total_pages = len(reader.pages) if hasattr(reader, "pages") else 0
 
+                # Bind loop-invariant lookups to locals for the per-page loop
+                cancel_is_set = self._cancel_event.is_set
+                add_page = writer.add_page
+                update_progress = self.update_progress
                 try:
                     for i, page in enumerate(reader.pages):
-                        if self._cancel_requested:
-                            return False, self.language_manager.get(
-                                "op_cancelled", "Operation cancelled by user"
-                            ) if self.language_manager else "Operation cancelled by user"
+                        # Pages are cheap here, so only poll for cancellation every 4th one
+                        if (i & 3) == 0 and cancel_is_set():
+                            return False, self._msg("op_cancelled")
                         try:
-                            writer.add_page(page)
+                            add_page(page)
                             pages_recovered += 1
                             if total_pages > 0:
-                                self.update_progress(30 + (60 * i // total_pages))
+                                update_progress(30 + (60 * i // total_pages))
                         except Exception:
                             # Skip corrupted pages
                             continue
@@ -365,32 +608,22 @@ class PDFOperations:
                 except Exception:
                     pass  # Continue with whatever pages we could recover
 
-                if pages_recovered > 0:
-
-                    def _write_repaired(tmpf):
-                        writer.write(tmpf)
-
-                    self._atomic_write_file(output_path, _write_repaired)
-                    self.update_progress(100)
-                    success_msg = (
-                        self.language_manager.get(
-                            "op_repair_success", "PDF repaired. Recovered {pages_recovered} pages"
-                        )
-                        if self.language_manager
-                        else "PDF repaired. Recovered {pages_recovered} pages"
-                    )
-                    return True, success_msg.format(pages_recovered=pages_recovered)
-                else:
-                    return False, self.language_manager.get(
-                        "op_repair_no_pages", "Could not recover any pages from the PDF"
-                    ) if self.language_manager else "Could not recover any pages from the PDF"
+                if pages_recovered == 0:
+                    return False, self._msg("op_repair_no_pages")
+                writer.write(repaired)
+
+            # Write only after the mapping is closed: output_path may be the input itself,
+            # and Windows cannot replace a file that is still mapped
+            def _write_repaired(tmpf):
+                tmpf.write(repaired.getbuffer())
+
+            self._atomic_write_file(output_path, _write_repaired)
+            self.update_progress(100)
+            success_msg = self._msg("op_repair_success")
+            return True, success_msg.format(pages_recovered=pages_recovered)
 
         except Exception as e:
-            error_msg = (
-                self.language_manager.get("op_repair_failed", "Repair failed: {error}")
-                if self.language_manager
-                else "Repair failed: {error}"
-            )
+            error_msg = self._msg("op_repair_failed")
             return False, error_msg.format(error=str(e))
 
     def get_pdf_info(self, file_path: str) -> dict:
@@ -407,29 +640,61 @@ class PDFOperations:
             if not PdfReader:
                 return {"error": "PyPDF2/pypdf not available"}
 
-            with open(file_path, "rb") as file:
-                reader = PdfReader(file)
+            with self._reader_lock:
+                reader, file_size = self._get_cached_reader(file_path)
+                return self._pdf_info_from_reader(reader, file_path, file_size)
 
-                info = {
-                    "pages": len(reader.pages),
-                    "file_size": os_path.getsize(file_path),
-                    "file_name": os_path.basename(file_path),
-                }
+        except Exception as e:
+            return {"error": str(e)}
 
-                if reader.metadata:
-                    info.update(
-                        {
-                            "title": reader.metadata.get("/Title", "Unknown"),
-                            "author": reader.metadata.get("/Author", "Unknown"),
-                            "creator": reader.metadata.get("/Creator", "Unknown"),
-                            "producer": reader.metadata.get("/Producer", "Unknown"),
-                        }
-                    )
+    def _get_cached_reader(self, file_path: str):
+        """
+        Return a parsed PdfReader for a read-only operation, reusing the last one while the file is unchanged
 
-                return info
+        Args:
+            file_path: Path to PDF file
 
-        except Exception as e:
-            return {"error": str(e)}
+        Returns:
+            Tuple of (PdfReader over an in-memory copy of the file, file size in bytes);
+            the size comes from the same stat used for the cache key
+
+        The caller holds _reader_lock for as long as it uses the returned reader.
+        """
+        stat = os.stat(file_path)
+        key = (os_path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        reader = self._reader_cache.get(key)
+        if reader is None:
+            reader = PdfReader(file_path)
+            # Only the most recent input is kept to bound memory use
+            self._reader_cache.clear()
+            self._reader_cache[key] = reader
+        return reader, stat.st_size
+
+    def _close_cached_docs(self):
+        """Drop cached readers, e.g. when the application state is reset"""
+        with self._reader_lock:
+            self._reader_cache.clear()
+
+    def _pdf_info_from_reader(self, reader, file_path: str, file_size: int) -> dict:
+        """Build the get_pdf_info dictionary from an already opened reader."""
+        info = {
+            "pages": _page_count(reader),
+            "file_size": file_size,
+            "file_name": os_path.basename(file_path),
+        }
+
+        metadata = reader.metadata
+        if metadata:
+            info.update(
+                {
+                    "title": metadata.get("/Title", "Unknown"),
+                    "author": metadata.get("/Author", "Unknown"),
+                    "creator": metadata.get("/Creator", "Unknown"),
+                    "producer": metadata.get("/Producer", "Unknown"),
+                }
+            )
+
+        return info
 
     def pdf_to_txt(self, input_path: str, output_path: str) -> Tuple[bool, str]:
         """
@@ -443,44 +708,89 @@ class PDFOperations:
             Tuple of (success: bool, message: str)
         """
         try:
-            if not PdfReader:
-                return False, self.language_manager.get(
-                    "op_pypdf_unavailable", "PyPDF2/pypdf not available"
-                ) if self.language_manager else "PyPDF2/pypdf not available"
+            if not pdfium and not PdfReader:
+                return False, self._msg("op_pypdf_unavailable")
+
+            # Prefer PDFium's C text extractor, fall back to PyPDF2's pure-Python one
+            if pdfium:
+                source = pdfium.PdfDocument(input_path)
+                total_pages = len(source)
+
+                def extract_text(index):
+                    return pdfium_page_text(source, index).encode("utf-8")
+
+            else:
+                source = map_file(input_path)
+                try:
+                    pages = PdfReader(source).pages
+                    total_pages = len(pages)
+                except Exception:
+                    source.close()
+                    raise
 
-            with open(input_path, "rb") as file:
-                reader = PdfReader(file)
-                text_content = ""
+                def extract_text(index):
+                    return pages[index].extract_text().encode("utf-8")
 
-                total_pages = len(reader.pages)
-                for i, page in enumerate(reader.pages):
-                    self.update_progress(int((i + 1) / total_pages * 100))
-                    if self._cancel_requested:
-                        return False, self.language_manager.get(
-                            "op_word_cancelled", "Operation cancelled"
-                        ) if self.language_manager else "Operation cancelled"
+            # A pool only pays off with more than one core to spread the pages over
+            workers = min(os.cpu_count() or 1, PARALLEL_TEXT_MAX_WORKERS)
+            if workers > 1 and total_pages >= PARALLEL_TEXT_MIN_PAGES:
+                page_texts = self._iter_page_texts_parallel(input_path, total_pages, workers)
+            else:
+                page_texts = (extract_text(i) for i in range(total_pages))
 
-                    text_content += page.extract_text() + "\n\n"
+            progress_scale = 100.0 / total_pages if total_pages else 0.0
 
+            # Write each page as it is extracted so only one page is held in memory;
+            # pages arrive already UTF-8 encoded (by the workers on the parallel path)
             def _write_text(tmpf):
-                tmpf.write(text_content.encode("utf-8"))
+                write = tmpf.write
+                cancel_is_set = self._cancel_event.is_set
+                for i, data in enumerate(page_texts):
+                    self.update_progress(int((i + 1) * progress_scale))
+                    if (i & 3) == 0 and cancel_is_set():
+                        raise OperationCancelled()
+                    write(data)
+                    write(b"\n\n")
 
-            self._atomic_write_file(output_path, _write_text)
-            success_msg = (
-                self.language_manager.get("op_text_success", "Text extracted to {output_path}")
-                if self.language_manager
-                else "Text extracted to {output_path}"
-            )
+            try:
+                self._atomic_write_file(output_path, _write_text)
+            except OperationCancelled:
+                return False, self._msg("op_word_cancelled")
+            finally:
+                page_texts.close()
+                source.close()
+
+            success_msg = self._msg("op_text_success")
             return True, success_msg.format(output_path=output_path)
 
         except Exception as e:
-            error_msg = (
-                self.language_manager.get("op_text_failed", "Text extraction failed: {error}")
-                if self.language_manager
-                else "Text extraction failed: {error}"
-            )
+            error_msg = self._msg("op_text_failed")
             return False, error_msg.format(error=str(e))
 
+    def _iter_page_texts_parallel(self, input_path: str, total_pages: int, workers: int):
+        """
+        Yield page texts in page order, extracted by a process pool in contiguous page chunks
+
+        Args:
+            input_path: Path to input PDF file
+            total_pages: Number of pages in the document
+            workers: Number of worker processes
+
+        Yields:
+            UTF-8 encoded text of each page
+        """
+        # Several chunks per worker keeps the ordered stream flowing
+        chunk_size = max(1, -(-total_pages // (workers * 4)))
+        starts = range(0, total_pages, chunk_size)
+        stops = [min(start + chunk_size, total_pages) for start in starts]
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for texts in executor.map(_extract_page_texts, repeat(input_path), starts, stops):
+                yield from texts
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def extract_hidden_info(self, input_path: str, output_path: str) -> Tuple[bool, str]:
         """
         Extract hidden information and metadata from PDF
@@ -494,70 +804,59 @@ class PDFOperations:
         """
         try:
             if not PdfReader:
-                return False, self.language_manager.get(
-                    "op_pypdf_unavailable", "PyPDF2/pypdf not available"
-                ) if self.language_manager else "PyPDF2/pypdf not available"
-
-            info = self.get_pdf_info(input_path)
-            if "error" in info:
-                return False, info["error"]
-
-            # Extract additional hidden information
-            hidden_info = []
-            hidden_info.append("=== PDF METADATA ===")
-            hidden_info.append(f"Title: {info.get('title', 'N/A')}")
-            hidden_info.append(f"Author: {info.get('author', 'N/A')}")
-            hidden_info.append(f"Creator: {info.get('creator', 'N/A')}")
-            hidden_info.append(f"Producer: {info.get('producer', 'N/A')}")
-            hidden_info.append(f"Pages: {info.get('pages', 'N/A')}")
-            hidden_info.append(f"File Size: {info.get('file_size', 'N/A')} bytes")
-
-            # Try to extract more detailed info
-            try:
-                with open(input_path, "rb") as file:
-                    reader = PdfReader(file)
-                    if reader.trailer and "/Info" in reader.trailer:
-                        info_dict = reader.trailer["/Info"]
-                        hidden_info.append("\n=== ADDITIONAL INFO DICTIONARY ===")
-                        for key, value in info_dict.items():
-                            hidden_info.append(f"{key}: {value}")
-            except Exception as e:
-                hidden_info.append(f"\nError extracting additional info: {str(e)}")
-
-            hidden_info.append("\n=== END OF EXTRACTED INFORMATION ===")
-            hidden_info.append("These details are extracted by SafePDF.")
-
-            # Write to output file atomically
-            def _write_info(tmpf):
-                tmpf.write("\n".join(hidden_info).encode("utf-8"))
-
-            self._atomic_write_file(output_path, _write_info)
-            success_msg = (
-                self.language_manager.get("op_hidden_success", "Hidden information extracted to {output_path}")
-                if self.language_manager
-                else "Hidden information extracted to {output_path}"
-            )
+                return False, self._msg("op_pypdf_unavailable")
+
+            # The trailer walk in _write_info resolves objects from the cached reader, so the
+            # lock is held until the file is written
+            with self._reader_lock:
+                # Parse the file once (or reuse the reader from get_pdf_info); the same reader
+                # feeds both the summary and the trailer walk
+                reader, file_size = self._get_cached_reader(input_path)
+                info_get = self._pdf_info_from_reader(reader, input_path, file_size).get
+
+                # Write each line straight to the temp file instead of building a list
+                def _write_info(tmpf):
+                    write = tmpf.write
+                    write(b"=== PDF METADATA ===\n")
+                    write(f"Title: {info_get('title', 'N/A')}\n".encode("utf-8"))
+                    write(f"Author: {info_get('author', 'N/A')}\n".encode("utf-8"))
+                    write(f"Creator: {info_get('creator', 'N/A')}\n".encode("utf-8"))
+                    write(f"Producer: {info_get('producer', 'N/A')}\n".encode("utf-8"))
+                    write(f"Pages: {info_get('pages', 'N/A')}\n".encode("utf-8"))
+                    write(f"File Size: {info_get('file_size', 'N/A')} bytes\n".encode("utf-8"))
+
+                    # Try to extract more detailed info
+                    try:
+                        trailer = reader.trailer
+                        if trailer and "/Info" in trailer:
+                            info_dict = trailer["/Info"]
+                            write(b"\n=== ADDITIONAL INFO DICTIONARY ===\n")
+                            for key, value in info_dict.items():
+                                write(f"{key}: {value}\n".encode("utf-8"))
+                    except Exception as e:
+                        write(f"\nError extracting additional info: {str(e)}\n".encode("utf-8"))
+
+                    write(b"\n=== END OF EXTRACTED INFORMATION ===\n")
+                    write(b"These details are extracted by SafePDF.")
+
+                self._atomic_write_file(output_path, _write_info)
+            success_msg = self._msg("op_hidden_success")
             return True, success_msg.format(output_path=output_path)
 
         except Exception as e:
-            error_msg = (
-                self.language_manager.get("op_hidden_failed", "Hidden info extraction failed: {error}")
-                if self.language_manager
-                else "Hidden info extraction failed: {error}"
-            )
+            error_msg = self._msg("op_hidden_failed")
             return False, error_msg.format(error=str(e))
 
-    def pdf_to_word(self, input_path: str, output_path: str) -> Tuple[bool, str]:
+    def pdf_to_word(self, input_path: str, output_path: str, include_images: bool = True) -> Tuple[bool, str]:
         """
         Convert PDF to Word document (delegates to PDFToWordConverter)
 
         Args:
             input_path: Path to input PDF file
             output_path: Path to output DOCX file
+            include_images: Embed a rendered image of each page
 
         Returns:
             Tuple of (success: bool, message: str)
         """
-        # Sync cancellation flag
-        self.word_converter._cancel_requested = self._cancel_requested
-        return self.word_converter.pdf_to_word(input_path, output_path)
+        return self.word_converter.pdf_to_word(input_path, output_path, include_images)
@@ -3,6 +3,8 @@ PDF Rotate Module for SafePDF
 Handles PDF rotation operations
 """
 
+import threading
+from io import BytesIO
 from typing import Tuple
 
 try:
@@ -10,13 +12,19 @@ try:
 except ImportError:
     PdfReader = PdfWriter = None
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
 from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.pdf_io import map_file
 
 
 class PDFRotator:
     """Class handling PDF rotation operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None):
+    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None, cancel_event=None):
         """
         Initialize PDF rotator
 
@@ -24,11 +32,12 @@ class PDFRotator:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
             atomic_write_file: Function for atomic file writing
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
         self._atomic_write_file = atomic_write_file
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDFRotate")
 
     def update_progress(self, value):
@@ -38,7 +47,7 @@ class PDFRotator:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def rotate_pdf(self, input_path: str, output_path: str, angle: int = 90) -> Tuple[bool, str]:
         """
@@ -53,31 +62,46 @@ class PDFRotator:
             Tuple of (success, message)
         """
         try:
-            if not PdfReader or not PdfWriter:
+            if not pikepdf and (not PdfReader or not PdfWriter):
                 return False, self.language_manager.get(
                     "op_pypdf_unavailable", "PyPDF2/pypdf not available"
                 ) if self.language_manager else "PyPDF2/pypdf not available"
 
             self.update_progress(10)
 
-            with open(input_path, "rb") as input_file:
-                reader = PdfReader(input_file)
-                writer = PdfWriter()
-
-                total_pages = len(reader.pages)
-                self.update_progress(30)
-
-                for i, page in enumerate(reader.pages):
-                    if self._cancel_requested:
-                        return False, self.language_manager.get(
-                            "op_cancelled", "Operation cancelled by user"
-                        ) if self.language_manager else "Operation cancelled by user"
-                    rotated_page = page.rotate(angle)
-                    writer.add_page(rotated_page)
-                    self.update_progress(30 + (60 * i // total_pages))
-
+            # qpdf only rewrites the page dictionaries; PyPDF2 re-serializes every object in Python
+            if pikepdf:
+                if not self._rotate_pikepdf(input_path, output_path, angle):
+                    return False, self.language_manager.get(
+                        "op_cancelled", "Operation cancelled by user"
+                    ) if self.language_manager else "Operation cancelled by user"
+            else:
+                rotated = BytesIO()
+                with map_file(input_path) as mapped:
+                    reader = PdfReader(mapped)
+                    writer = PdfWriter()
+
+                    total_pages = len(reader.pages)
+                    self.update_progress(30)
+
+                    # Bind loop-invariant lookups to locals for the per-page loop
+                    cancel_is_set = self._cancel_event.is_set
+                    add_page = writer.add_page
+                    update_progress = self.update_progress
+                    for i, page in enumerate(reader.pages):
+                        # Pages are cheap here, so only poll for cancellation every 4th one
+                        if (i & 3) == 0 and cancel_is_set():
+                            return False, self.language_manager.get(
+                                "op_cancelled", "Operation cancelled by user"
+                            ) if self.language_manager else "Operation cancelled by user"
+                        add_page(page.rotate(angle))
+                        update_progress(30 + (60 * i // total_pages))
+                    writer.write(rotated)
+
+                # Write only after the mapping is closed: output_path may be the input itself,
+                # and Windows cannot replace a file that is still mapped
                 def _write_rotated(tmpf):
-                    writer.write(tmpf)
+                    tmpf.write(rotated.getbuffer())
 
                 if self._atomic_write_file:
                     self._atomic_write_file(output_path, _write_rotated)
@@ -100,3 +124,38 @@ class PDFRotator:
                 else "Rotation failed: {error}"
             )
             return False, error_msg.format(error=str(e))
+
+    def _rotate_pikepdf(self, input_path: str, output_path: str, angle: int) -> bool:
+        """
+        Rotate PDF pages with pikepdf (qpdf), keeping the encoded content streams untouched
+
+        Args:
+            input_path: Input PDF file path
+            output_path: Output PDF file path
+            angle: Rotation angle (90, 180, 270)
+
+        Returns:
+            False if the operation was cancelled, True otherwise
+        """
+        with pikepdf.open(input_path) as pdf:
+            total_pages = len(pdf.pages)
+            self.update_progress(30)
+
+            cancel_is_set = self._cancel_event.is_set
+            for i, page in enumerate(pdf.pages):
+                # Pages are cheap here, so only poll for cancellation every 4th one
+                if (i & 3) == 0 and cancel_is_set():
+                    return False
+                page.rotate(angle, relative=True)
+                self.update_progress(30 + (60 * i // total_pages))
+
+            def _write_rotated(tmpf):
+                pdf.save(tmpf)
+
+            if self._atomic_write_file:
+                self._atomic_write_file(output_path, _write_rotated)
+            else:
+                with open(output_path, "wb") as f:
+                    _write_rotated(f)
+
+        return True
@@ -3,6 +3,14 @@ PDF Split Module for SafePDF
 Handles PDF splitting operations
 """
 
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+from itertools import repeat
 from os import path as os_path
 from typing import List, Optional, Tuple
 
@@ -11,13 +19,77 @@ try:
 except ImportError:
     PdfReader = PdfWriter = None
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
 from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.pdf_io import map_file
+
+# Page-by-page splits of documents with at least this many pages are
+# serialized by a process pool; below it the pool start-up cost outweighs the gain
+PARALLEL_SPLIT_MIN_PAGES = 1024
+PARALLEL_SPLIT_MAX_WORKERS = 4
+
+# One comma-separated page range entry: "7" or "10-12", whitespace allowed
+_PAGE_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+
+def _save_part_pikepdf(pages, page_indices, file):
+    """Save the given pages of a pikepdf document as a new PDF to an open binary file"""
+    with pikepdf.new() as part:
+        part.pages.extend(pages[page_num] for page_num in page_indices)
+        part.save(file)
+
+
+def _save_part_pypdf(pages, page_indices, file):
+    """Save the given pages of a PyPDF2 document as a new PDF to an open binary file"""
+    writer = PdfWriter()
+    for page_num in page_indices:
+        writer.add_page(pages[page_num])
+    writer.write(file)
+
+
+def _serialize_pages(input_path: str, start: int, stop: int) -> List[bytes]:
+    """
+    Serialize pages [start, stop) as single-page PDFs in a worker process
+
+    Args:
+        input_path: Path to input PDF file
+        start: Index of the first page
+        stop: Index one past the last page
+
+    Returns:
+        One PDF file's bytes per page, in page order
+    """
+    if pikepdf:
+        source = pikepdf.open(input_path)
+        pages = source.pages
+        save_part = _save_part_pikepdf
+    else:
+        source = map_file(input_path)
+        pages = PdfReader(source).pages
+        save_part = _save_part_pypdf
+
+    results = []
+    with source:
+        for page_num in range(start, stop):
+            buffer = BytesIO()
+            save_part(pages, (page_num,), buffer)
+            results.append(buffer.getvalue())
+    return results
+
+
+def _write_bytes(data: bytes, file):
+    """Write already serialized PDF bytes to an open binary file"""
+    file.write(data)
 
 
 class PDFSplitter:
     """Class handling PDF split operations"""
 
-    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None):
+    def __init__(self, progress_callback=None, language_manager=None, atomic_write_file=None, cancel_event=None):
         """
         Initialize PDF splitter
 
@@ -25,11 +97,12 @@ class PDFSplitter:
             progress_callback: Function to call for progress updates (0-100)
             language_manager: Language manager for localization
             atomic_write_file: Function for atomic file writing
+            cancel_event: Shared threading.Event that is set when cancellation is requested
         """
         self.progress_callback = progress_callback
         self.language_manager = language_manager
         self._atomic_write_file = atomic_write_file
-        self._cancel_requested = False
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.logger = get_logger("SafePDF.PDFSplit")
 
     def update_progress(self, value):
@@ -39,10 +112,15 @@ class PDFSplitter:
 
     def request_cancel(self):
         """Request cancellation of a running operation."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def split_pdf(
-        self, input_path: str, output_dir: str, method: str = "pages", page_range: Optional[str] = None
+        self,
+        input_path: str,
+        output_dir: str,
+        method: str = "pages",
+        page_range: Optional[str] = None,
+        chunk_size: int = 1,
     ) -> Tuple[bool, str]:
         """
         Split PDF into multiple files
@@ -52,95 +130,98 @@ class PDFSplitter:
             output_dir: Directory to save split files
             method: Split method ("pages" for each page, "range" for specific range)
             page_range: Page range if method is "range" (e.g., "1-5,7,10-12")
+            chunk_size: Pages per output file if method is "pages"; fewer, larger files split faster
 
         Returns:
             Tuple of (success, message)
         """
         try:
-            if not PdfReader or not PdfWriter:
+            if not pikepdf and (not PdfReader or not PdfWriter):
                 return False, self.language_manager.get(
                     "op_pypdf_unavailable", "PyPDF2/pypdf not available"
                 ) if self.language_manager else "PyPDF2/pypdf not available"
 
             self.update_progress(10)
 
-            with open(input_path, "rb") as input_file:
-                reader = PdfReader(input_file)
-                total_pages = len(reader.pages)
+            # qpdf copies each page's objects once per output; PyPDF2 re-walks and re-serializes them in Python
+            if pikepdf:
+                source = pikepdf.open(input_path)
+                pages = source.pages
+                save_part = _save_part_pikepdf
+            else:
+                source = map_file(input_path)
+                pages = PdfReader(source).pages
+                save_part = _save_part_pypdf
+
+            with source:
+                total_pages = len(pages)
 
                 self.update_progress(20)
 
-                if method == "pages":
+                if method == "pages" and chunk_size > 1:
+                    # Split into files of chunk_size consecutive pages
+                    parts = [
+                        (
+                            f"pages_{start + 1}-{min(start + chunk_size, total_pages)}.pdf",
+                            range(start, min(start + chunk_size, total_pages)),
+                        )
+                        for start in range(0, total_pages, chunk_size)
+                    ]
+                elif method == "pages":
                     # Split each page into separate file
-                    for i, page in enumerate(reader.pages):
-                        if self._cancel_requested:
-                            return False, self.language_manager.get(
-                                "op_cancelled", "Operation cancelled by user"
-                            ) if self.language_manager else "Operation cancelled by user"
-                        writer = PdfWriter()
-                        writer.add_page(page)
-
-                        output_filename = f"page_{i + 1}.pdf"
-                        output_path = os_path.join(output_dir, output_filename)
-
-                        def _write_page(tmpf):
-                            writer.write(tmpf)
-
-                        if self._atomic_write_file:
-                            self._atomic_write_file(output_path, _write_page)
-                        else:
-                            with open(output_path, "wb") as f:
-                                _write_page(f)
-
-                        self.update_progress(20 + (70 * i // total_pages))
-
-                    self.update_progress(100)
-                    success_msg = (
-                        self.language_manager.get("op_split_pages", "PDF split into {total_pages} files")
-                        if self.language_manager
-                        else "PDF split into {total_pages} files"
-                    )
-                    return True, success_msg.format(total_pages=total_pages)
-
+                    parts = [(f"page_{i + 1}.pdf", (i,)) for i in range(total_pages)]
                 elif method == "range" and page_range:
                     # Parse page range and create files
                     ranges = self._parse_page_range(page_range, total_pages)
-
-                    for i, (start, end) in enumerate(ranges):
-                        if self._cancel_requested:
+                    parts = [
+                        (f"pages_{start}-{end}.pdf", [n for n in range(start - 1, end) if 0 <= n < total_pages])
+                        for start, end in ranges
+                    ]
+                else:
+                    return False, "Invalid split method or parameters"
+
+                # Serialize large page-by-page splits in worker processes; files are still written here
+                page_data = None
+                workers = min(os.cpu_count() or 1, PARALLEL_SPLIT_MAX_WORKERS)
+                if method == "pages" and chunk_size <= 1 and workers > 1 and total_pages >= PARALLEL_SPLIT_MIN_PAGES:
+                    page_data = self._iter_page_data_parallel(input_path, total_pages, workers)
+
+                try:
+                    for i, (output_filename, page_indices) in enumerate(parts):
+                        if self._cancel_event.is_set():
                             return False, self.language_manager.get(
                                 "op_cancelled", "Operation cancelled by user"
                             ) if self.language_manager else "Operation cancelled by user"
-                        writer = PdfWriter()
-                        for page_num in range(start - 1, end):
-                            if 0 <= page_num < total_pages:
-                                writer.add_page(reader.pages[page_num])
 
-                        output_filename = f"pages_{start}-{end}.pdf"
                         output_path = os_path.join(output_dir, output_filename)
-
-                        def _write_range(tmpf):
-                            writer.write(tmpf)
-
-                        if self._atomic_write_file:
-                            self._atomic_write_file(output_path, _write_range)
+                        if page_data is not None:
+                            self._write_output(output_path, partial(_write_bytes, next(page_data)))
+                        elif len(page_indices) == total_pages:
+                            # A part covering the whole document is the input file itself; copy the bytes
+                            self._copy_source(input_path, output_path)
                         else:
-                            with open(output_path, "wb") as f:
-                                _write_range(f)
-
-                        self.update_progress(20 + (70 * i // len(ranges)))
-
-                    self.update_progress(100)
-                    success_msg = (
-                        self.language_manager.get(
-                            "op_split_ranges", "PDF split into {num_ranges} files based on ranges"
-                        )
-                        if self.language_manager
-                        else "PDF split into {num_ranges} files based on ranges"
-                    )
-                    return True, success_msg.format(num_ranges=len(ranges))
-
-            return False, "Invalid split method or parameters"
+                            self._write_output(output_path, partial(save_part, pages, page_indices))
+
+                        self.update_progress(20 + (70 * i // len(parts)))
+                finally:
+                    if page_data is not None:
+                        page_data.close()
+
+            self.update_progress(100)
+            if method == "pages":
+                success_msg = (
+                    self.language_manager.get("op_split_pages", "PDF split into {total_pages} files")
+                    if self.language_manager
+                    else "PDF split into {total_pages} files"
+                )
+                return True, success_msg.format(total_pages=len(parts))
+
+            success_msg = (
+                self.language_manager.get("op_split_ranges", "PDF split into {num_ranges} files based on ranges")
+                if self.language_manager
+                else "PDF split into {num_ranges} files based on ranges"
+            )
+            return True, success_msg.format(num_ranges=len(parts))
 
         except Exception as e:
             error_msg = (
@@ -150,6 +231,49 @@ class PDFSplitter:
             )
             return False, error_msg.format(error=str(e))
 
+    def _write_output(self, output_path: str, write_func):
+        """Write one output file through the atomic writer when available"""
+        if self._atomic_write_file:
+            self._atomic_write_file(output_path, write_func)
+        else:
+            with open(output_path, "wb") as f:
+                write_func(f)
+
+    def _copy_source(self, input_path: str, output_path: str):
+        """Copy the input PDF unchanged to output_path"""
+        if os_path.exists(output_path) and os_path.samefile(input_path, output_path):
+            return
+
+        def _copy(tmpf):
+            with open(input_path, "rb") as src:
+                shutil.copyfileobj(src, tmpf, 1 << 20)
+
+        self._write_output(output_path, _copy)
+
+    def _iter_page_data_parallel(self, input_path: str, total_pages: int, workers: int):
+        """
+        Yield single-page PDFs in page order, serialized by a process pool in contiguous page chunks
+
+        Args:
+            input_path: Path to input PDF file
+            total_pages: Number of pages in the document
+            workers: Number of worker processes
+
+        Yields:
+            Bytes of one single-page PDF per page
+        """
+        # Several chunks per worker keeps the ordered stream flowing
+        chunk_size = max(1, -(-total_pages // (workers * 4)))
+        starts = range(0, total_pages, chunk_size)
+        stops = [min(start + chunk_size, total_pages) for start in starts]
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for chunk in executor.map(_serialize_pages, repeat(input_path), starts, stops):
+                yield from chunk
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _parse_page_range(self, page_range: str, total_pages: int) -> List[Tuple[int, int]]:
         """
         Parse page range string into list of (start, end) tuples
@@ -162,17 +286,12 @@ class PDFSplitter:
             List of (start, end) tuples
         """
         ranges = []
-        parts = page_range.split(",")
-
-        for part in parts:
-            part = part.strip()
-            if "-" in part:
-                start, end = part.split("-", 1)
-                start = max(1, min(int(start.strip()), total_pages))
-                end = max(start, min(int(end.strip()), total_pages))
-                ranges.append((start, end))
-            else:
-                page_num = max(1, min(int(part.strip()), total_pages))
-                ranges.append((page_num, page_num))
+        for part in page_range.split(","):
+            match = _PAGE_RANGE_RE.fullmatch(part)
+            if not match:
+                raise ValueError(f"Invalid page range: {part.strip()!r}")
+            start = max(1, min(int(match[1]), total_pages))
+            end = start if match[2] is None else max(start, min(int(match[2]), total_pages))
+            ranges.append((start, end))
 
         return ranges
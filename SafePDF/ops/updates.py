@@ -6,12 +6,20 @@ This module handles checking for updates from GitHub Releases,
 downloading and verifying releases using GPG signatures.
 """
 
+import hashlib
+import json
+import os
 import platform
+import re
+import shutil
 import sys
 import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse
+from urllib.request import Request, urlopen
 
 try:
     import gnupg
@@ -21,8 +29,36 @@ except ImportError as e:
     print("Please install with: pip install requests PyGitHub python-gnupg")
     sys.exit(1)
 
+try:
+    import pgpy
+    from pgpy.errors import PGPError
+except ImportError:
+    pgpy = None
+
 from SafePDF.logger.logging_config import get_logger
 
+# Latest-release response from the GitHub API, kept with its ETag/Last-Modified
+# so later checks can be answered by a conditional GET (304, no body)
+RELEASE_CACHE_FILE = Path.home() / ".safepdf" / "release_cache.json"
+# A release lookup (or failed lookup) younger than this is reused without contacting GitHub
+RELEASE_CACHE_TTL = 300
+# Release asset names for this platform (matched lowercased), and detached signature assets
+_PLATFORM_ASSET_PATTERNS = {
+    "windows": ["windows", "win", ".exe", ".msi"],
+    "linux": ["linux", ".deb", ".rpm", ".tar.gz"],
+    "darwin": ["macos", "darwin", "osx", ".dmg", ".pkg"],
+}.get(platform.system().lower(), [])
+_PLATFORM_ASSET_RE = (
+    re.compile("|".join(re.escape(pattern) for pattern in _PLATFORM_ASSET_PATTERNS))
+    if _PLATFORM_ASSET_PATTERNS
+    else None
+)
+_SIGNATURE_ASSET_RE = re.compile(r"\.sig(?:\.|$)")
+# SHA-256 checksum assets: "<asset>.sha256" for one file, or a "SHA256SUMS" list
+_CHECKSUM_ASSET_RE = re.compile(r"\.sha256$|^sha256sums(?:\.txt)?$")
+# Downloads and digests are streamed in chunks of this size instead of whole-file reads
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class SafePDFUpdates:
     """Handles GitHub releases, updates, and GPG signature verification"""
@@ -31,21 +67,40 @@ class SafePDFUpdates:
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.github = Github()  # Uses anonymous access for public repos
-        self.repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
+        self._repo = None
+        self._release_failure = None
         self.logger = get_logger("SafePDF.Updates")
 
-        # Initialize GPG
-        try:
-            self.gpg = gnupg.GPG()
+        # Initialize GPG; PGPy verifies in-process, so the gpg binary is only needed without it
+        self.gpg = None
+        if pgpy:
             self.gpg_available = True
-        except (OSError, FileNotFoundError):
-            self.logger.warning("GPG not available - signature verification disabled")
-            self.gpg = None
-            self.gpg_available = False
+        else:
+            try:
+                self.gpg = gnupg.GPG()
+                self.gpg_available = True
+            except (OSError, FileNotFoundError):
+                self.logger.warning("GPG not available - signature verification disabled")
+                self.gpg_available = False
+
+        # Each gpg call spawns a process; remember imported keys and verification
+        # outcomes for this session. Outcomes are dropped whenever the keyring gains a key.
+        self._imported_keys = {}
+        self._verify_cache = {}
+        self._default_public_key = None
+        # Keys imported into PGPy, by fingerprint (PGPy has no persistent keyring)
+        self._pgp_keys = {}
 
         # Get current version
         self.current_version = self._get_current_version()
 
+    @property
+    def repo(self):
+        """GitHub repository handle, fetched on first use instead of at start-up"""
+        if self._repo is None:
+            self._repo = self.github.get_repo(f"{self.repo_owner}/{self.repo_name}")
+        return self._repo
+
     def _get_current_version(self):
         """Get current application version"""
         try:
@@ -68,14 +123,14 @@ class SafePDFUpdates:
         """
         try:
             # Get latest release
-            latest_release = self.repo.get_latest_release()
+            latest_release = self._get_latest_release()
 
-            latest_version = latest_release.tag_name.lstrip("v")
+            latest_version = latest_release["tag_name"].lstrip("v")
             current_version = self.current_version.lstrip("v")
 
             if self._is_newer_version(latest_version, current_version):
                 # Find appropriate asset for current platform
-                download_url, signature_url = self._get_platform_asset(latest_release)
+                download_url, signature_url, checksum_url = self._get_platform_asset(latest_release)
 
                 if download_url:
                     return {
@@ -83,8 +138,9 @@ class SafePDFUpdates:
                         "latest_version": latest_version,
                         "download_url": download_url,
                         "signature_url": signature_url,
-                        "changelog": latest_release.body,
-                        "release_url": latest_release.html_url,
+                        "checksum_url": checksum_url,
+                        "changelog": latest_release.get("body"),
+                        "release_url": latest_release.get("html_url"),
                     }
 
             return {"available": False}
@@ -93,6 +149,73 @@ class SafePDFUpdates:
             self.logger.error(f"Error checking for updates: {e}")
             return None
 
+    def _get_latest_release(self):
+        """
+        Get the latest release as the GitHub REST API payload
+
+        Within RELEASE_CACHE_TTL the cached payload is reused as is; after that it is
+        re-validated with If-None-Match/If-Modified-Since, so an unchanged release costs
+        a 304 response. A failed lookup is remembered for RELEASE_CACHE_TTL as well.
+
+        Returns:
+            dict: Release payload (tag_name, name, body, html_url, published_at, assets)
+        """
+        now = time.time()
+        if self._release_failure and now - self._release_failure[0] < RELEASE_CACHE_TTL:
+            raise self._release_failure[1]
+
+        cache = self._load_release_cache()
+        if cache and 0 <= now - cache.get("checked_at", 0) < RELEASE_CACHE_TTL:
+            return cache["payload"]
+
+        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases/latest"
+        headers = {"Accept": "application/vnd.github+json"}
+        if cache and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache and cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
+        try:
+            try:
+                with urlopen(Request(url, headers=headers), timeout=15) as response:
+                    cache = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "payload": json.load(response),
+                    }
+            except HTTPError as e:
+                # 304 Not Modified: the cached payload is still current
+                if e.code != 304 or not cache:
+                    raise
+        except Exception as e:
+            self._release_failure = (now, e)
+            raise
+
+        self._release_failure = None
+        cache["checked_at"] = now
+        self._save_release_cache(cache)
+        return cache["payload"]
+
+    def _load_release_cache(self):
+        """Load the cached latest-release response, or None if absent or unreadable"""
+        try:
+            with open(RELEASE_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) and isinstance(cache.get("payload"), dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _save_release_cache(self, cache):
+        """Save the latest-release response cache; failures only cost a full fetch next time"""
+        try:
+            RELEASE_CACHE_FILE.parent.mkdir(exist_ok=True)
+            tmp_path = RELEASE_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, RELEASE_CACHE_FILE)
+        except OSError as e:
+            self.logger.debug(f"Error saving release cache: {e}")
+
     def _is_newer_version(self, latest, current):
         """Compare version strings"""
         try:
@@ -107,38 +230,44 @@ class SafePDFUpdates:
         """
         Get the appropriate asset for the current platform
 
+        Args:
+            release: Release payload from _get_latest_release
+
         Returns:
-            tuple: (download_url, signature_url) or (None, None)
+            tuple: (download_url, signature_url, checksum_url); each is None if not found
         """
-        system = platform.system().lower()
-        platform.machine().lower()
-
-        # Map platform to asset name patterns
-        platform_patterns = {
-            "windows": ["windows", "win", ".exe", ".msi"],
-            "linux": ["linux", ".deb", ".rpm", ".tar.gz"],
-            "darwin": ["macos", "darwin", "osx", ".dmg", ".pkg"],
-        }
-
-        patterns = platform_patterns.get(system, [])
-
+        download_name = None
         download_url = None
         signature_url = None
+        checksums = {}
+
+        for asset in release.get("assets", []):
+            name = asset["name"].lower()
 
-        for asset in release.assets:
-            name = asset.name.lower()
+            # Check for checksum file
+            if _CHECKSUM_ASSET_RE.search(name):
+                checksums[name] = asset["browser_download_url"]
+                continue
 
             # Check for main binary
-            if any(pattern in name for pattern in patterns) and not name.endswith(".sig"):
-                download_url = asset.browser_download_url
+            if _PLATFORM_ASSET_RE and _PLATFORM_ASSET_RE.search(name) and not name.endswith(".sig"):
+                download_name = name
+                download_url = asset["browser_download_url"]
 
             # Check for signature file
-            if name.endswith(".sig") or ".sig." in name:
-                signature_url = asset.browser_download_url
+            if _SIGNATURE_ASSET_RE.search(name):
+                signature_url = asset["browser_download_url"]
 
-        return download_url, signature_url
+        # Prefer the binary's own checksum file over a checksum list
+        checksum_url = None
+        if download_name:
+            checksum_url = checksums.get(f"{download_name}.sha256") or next(
+                (url for name, url in checksums.items() if name.startswith("sha256sums")), None
+            )
 
-    def download_and_verify(self, download_url, signature_url, public_key=None):
+        return download_url, signature_url, checksum_url
+
+    def download_and_verify(self, download_url, signature_url, public_key=None, checksum_url=None):
         """
         Download a release and verify its GPG signature
 
@@ -146,6 +275,7 @@ class SafePDFUpdates:
             download_url: URL to download the release
             signature_url: URL to download the signature
             public_key: ASCII-armored public key for verification
+            checksum_url: Optional URL of the release's SHA-256 checksum, checked before the signature
 
         Returns:
             tuple: (success, file_path, error_message)
@@ -154,28 +284,34 @@ class SafePDFUpdates:
             return False, None, "GPG not available for signature verification"
 
         try:
-            # Import public key if provided
+            # Import public key if provided; PGPy has no system keyring to fall back on
             if public_key:
-                self.gpg.import_keys(public_key)
+                self._import_key(public_key)
+            elif pgpy and not self._pgp_keys:
+                self._import_key(self._get_default_public_key())
 
             # Download files
             with tempfile.TemporaryDirectory() as temp_dir:
                 # Download the release
                 release_path = Path(temp_dir) / "release"
                 self._download_file(download_url, release_path)
+                data_digest = self._sha256_file(release_path)
+
+                # The checksum is a cheap first gate; a mismatch is retried once in case the download was damaged
+                if checksum_url:
+                    expected_digest = self._fetch_expected_digest(checksum_url, download_url)
+                    if data_digest != expected_digest:
+                        self._download_file(download_url, release_path)
+                        data_digest = self._sha256_file(release_path)
+                        if data_digest != expected_digest:
+                            return False, None, "Checksum verification failed"
 
                 # Download signature
                 sig_path = Path(temp_dir) / "release.sig"
                 self._download_file(signature_url, sig_path)
 
                 # Verify signature
-                with open(sig_path, "rb") as f:
-                    signature_data = f.read()
-
-                with open(release_path, "rb") as f:
-                    file_data = f.read()
-
-                verified = self.gpg.verify_data(signature_data, file_data)
+                verified = self._verify_detached_file(sig_path, release_path, data_digest)
 
                 if verified:
                     # Move to permanent location
@@ -196,7 +332,7 @@ class SafePDFUpdates:
         """Download a file from URL to destination path"""
         try:
             with urlopen(url) as response, open(dest_path, "wb") as out_file:
-                out_file.write(response.read())
+                shutil.copyfileobj(response, out_file, _DOWNLOAD_CHUNK_SIZE)
         except URLError as e:
             raise Exception(f"Failed to download {url}: {e}")
 
@@ -230,8 +366,7 @@ class SafePDFUpdates:
                 public_key = self._get_default_public_key()
 
             # Import the public key
-            import_result = self.gpg.import_keys(public_key)
-            if not import_result.fingerprints:
+            if not self._import_key(public_key):
                 return False
 
             # For detached signature verification, we need the signed data
@@ -242,16 +377,156 @@ class SafePDFUpdates:
             with open(license_file_path, "rb") as f:
                 signature_data = f.read()
 
-            verified = self.gpg.verify_data(signature_data, signed_data)
-
-            return verified.valid
+            return self._verify_detached(signature_data, signed_data)
 
         except Exception as e:
             self.logger.error(f"Error verifying license file: {e}")
             return False
 
+    def _import_key(self, public_key):
+        """
+        Import an ASCII-armored public key into the GPG keyring, once per session
+
+        Returns:
+            tuple: Fingerprints of the imported key(s); empty if the import failed
+        """
+        key_digest = hashlib.sha256(public_key.encode() if isinstance(public_key, str) else public_key).digest()
+        fingerprints = self._imported_keys.get(key_digest)
+        if fingerprints is None:
+            if pgpy:
+                fingerprints = self._import_key_pgpy(public_key)
+            else:
+                fingerprints = tuple(self.gpg.import_keys(public_key).fingerprints)
+            if fingerprints:
+                self._imported_keys[key_digest] = fingerprints
+                # A new key can make previously failed verifications succeed
+                self._verify_cache.clear()
+        return fingerprints
+
+    def _verify_detached(self, signature_data, signed_data):
+        """
+        Verify a detached signature, reusing the outcome for identical signature and data
+
+        Returns:
+            bool: True if the signature is valid
+        """
+
+        def verify():
+            if pgpy:
+                return self._verify_detached_pgpy(signature_data, signed_data)
+            return bool(self.gpg.verify_data(signature_data, signed_data).valid)
+
+        return self._verify_cached(signature_data, hashlib.sha256(signed_data).digest(), verify)
+
+    def _verify_detached_file(self, signature_path, data_path, data_digest=None):
+        """
+        Verify a detached signature over a file without holding the file in memory for gpg
+
+        Args:
+            signature_path: Path to the detached signature
+            data_path: Path to the signed file
+            data_digest: SHA-256 digest of the signed file, if already computed
+
+        Returns:
+            bool: True if the signature is valid
+        """
+        with open(signature_path, "rb") as f:
+            signature_data = f.read()
+
+        if data_digest is None:
+            data_digest = self._sha256_file(data_path)
+
+        def verify():
+            if pgpy:
+                # PGPy only verifies in-memory bytes
+                return self._verify_detached_pgpy(signature_data, Path(data_path).read_bytes())
+            # gpg reads the data file itself; only the signature is piped in
+            with open(signature_path, "rb") as signature_file:
+                return bool(self.gpg.verify_file(signature_file, str(data_path)).valid)
+
+        return self._verify_cached(signature_data, data_digest, verify)
+
+    def _sha256_file(self, path):
+        """Return the SHA-256 digest of a file, read in chunks"""
+        data_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_DOWNLOAD_CHUNK_SIZE), b""):
+                data_hash.update(chunk)
+        return data_hash.digest()
+
+    def _fetch_expected_digest(self, checksum_url, download_url):
+        """
+        Download a checksum asset and return the SHA-256 digest it lists for the download
+
+        Accepts a bare hex digest or "sha256sum"-style lines ("<hex>  <file name>").
+
+        Returns:
+            bytes: Expected SHA-256 digest
+        """
+        try:
+            with urlopen(checksum_url) as response:
+                lines = response.read().decode("utf-8", "replace").splitlines()
+        except URLError as e:
+            raise Exception(f"Failed to download {checksum_url}: {e}")
+
+        file_name = unquote(Path(urlparse(download_url).path).name).lower()
+        for line in lines:
+            fields = line.split()
+            if len(fields) == 1 or (len(fields) == 2 and fields[1].lstrip("*").lower() == file_name):
+                try:
+                    return bytes.fromhex(fields[0])
+                except ValueError:
+                    continue
+        raise Exception(f"No SHA-256 checksum for {file_name} in {checksum_url}")
+
+    def _verify_cached(self, signature_data, data_digest, verify):
+        """
+        Return the outcome cached in this session for a signature and data digest, else call verify()
+
+        Outcomes are deliberately never persisted: a record on disk is user-writable and
+        would let a forged signature pass without ever being checked.
+
+        Returns:
+            bool: True if the signature is valid
+        """
+        cache_key = (hashlib.sha256(signature_data).digest(), data_digest)
+        valid = self._verify_cache.get(cache_key)
+        if valid is None:
+            valid = verify()
+            self._verify_cache[cache_key] = valid
+        return valid
+
+    def _import_key_pgpy(self, public_key):
+        """Parse an ASCII-armored public key with PGPy; returns its fingerprint(s)"""
+        try:
+            key, _ = pgpy.PGPKey.from_blob(public_key)
+        except (PGPError, ValueError) as e:
+            self.logger.error(f"Error parsing public key: {e}")
+            return ()
+        fingerprint = str(key.fingerprint)
+        self._pgp_keys[fingerprint] = key
+        return (fingerprint,)
+
+    def _verify_detached_pgpy(self, signature_data, signed_data):
+        """Verify a detached signature in-process against the keys imported into PGPy"""
+        signature = pgpy.PGPSignature.from_blob(signature_data)
+        for key in self._pgp_keys.values():
+            try:
+                if key.verify(signed_data, signature):
+                    return True
+            except PGPError:
+                # Signature was made by a different key
+                continue
+        return False
+
     def _get_default_public_key(self):
-        """Get the default public key for verification"""
+        """Get the default public key for verification; the bundled key files are read once"""
+        if self._default_public_key is None:
+            self._default_public_key = self._read_default_public_key()
+        return self._default_public_key
+
+    def _read_default_public_key(self):
+        """Read the bundled public key, trying PGP key files before the PEM file"""
         key_dir = Path(__file__).parent.parent / "key"
 
         # Try PGP key files first
@@ -291,11 +566,23 @@ class SafePDFUpdates:
             dict: Release information
         """
         try:
-            if version:
-                release = self.repo.get_release(version)
-            else:
-                release = self.repo.get_latest_release()
-
+            if not version:
+                release = self._get_latest_release()
+                published_at = release.get("published_at")
+                return {
+                    "version": release["tag_name"],
+                    "name": release.get("name"),
+                    "description": release.get("body"),
+                    "published_at": datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+                    if published_at
+                    else None,
+                    "assets": [
+                        {"name": asset["name"], "url": asset["browser_download_url"]}
+                        for asset in release.get("assets", [])
+                    ],
+                }
+
+            release = self.repo.get_release(version)
             return {
                 "version": release.tag_name,
                 "name": release.title,
@@ -21,6 +21,7 @@ if parent_dir not in sys.path:
 
 import tkinter as tk  # noqa: E402
 from ctypes import windll  # noqa: E402
+from multiprocessing import freeze_support  # noqa: E402
 from pathlib import Path  # noqa: E402
 
 from tkinterdnd2 import TkinterDnD  # noqa: E402
@@ -108,6 +109,9 @@ class SafePDFApp:
 
 def main():
     """Main application entry point"""
+    # Required for the process pools used by PDF operations in frozen builds
+    freeze_support()
+
     try:
         root = TkinterDnD.Tk()  # Use TkinterDnD root for drag-and-drop support
     except Exception:
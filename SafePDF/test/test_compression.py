@@ -5,6 +5,9 @@ Test script for PDF compression functionality
 
 import os
 
+import pytest
+
+from SafePDF.ops.pdf_compress import _is_already_optimized
 from SafePDF.ops.pdf_operations import PDFOperations
 
 
@@ -75,5 +78,34 @@ def test_compression():
     return True
 
 
+def _write_sample_pdf(path, producer=None, linearize=False):
+    """Write a three-page PDF with pikepdf, optionally with a /Producer or linearized"""
+    pikepdf = pytest.importorskip("pikepdf")
+    with pikepdf.new() as pdf:
+        for _ in range(3):
+            pdf.add_blank_page()
+        if producer:
+            pdf.docinfo["/Producer"] = producer
+        pdf.save(path, linearize=linearize)
+    return str(path)
+
+
+def test_already_optimized_detection(tmp_path):
+    """Only linearized files and known optimizer output count as already optimized"""
+    assert _is_already_optimized(_write_sample_pdf(tmp_path / "linearized.pdf", linearize=True))
+    assert _is_already_optimized(_write_sample_pdf(tmp_path / "gs.pdf", producer="GPL Ghostscript 10.02.1"))
+    assert not _is_already_optimized(_write_sample_pdf(tmp_path / "plain.pdf", producer="pdfTeX-1.40.24"))
+    assert not _is_already_optimized(str(tmp_path / "missing.pdf"))
+
+
+def test_already_optimized_result_is_reported(tmp_path):
+    """The message says the lossless rewrite replaced the requested preset"""
+    input_path = _write_sample_pdf(tmp_path / "linearized.pdf", linearize=True)
+
+    _, message = PDFOperations().compress_pdf(input_path, str(tmp_path / "out.pdf"), "low")
+
+    assert "already optimized" in message
+
+
 if __name__ == "__main__":
     test_compression()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the page range parser used by PDF splitting
+"""
+
+import pytest
+
+from SafePDF.ops.pdf_split import PDFSplitter
+
+
+@pytest.fixture
+def splitter():
+    return PDFSplitter()
+
+
+def test_ranges_and_single_pages(splitter):
+    """Comma-separated ranges and single pages are parsed in order"""
+    assert splitter._parse_page_range("1-3,5", 10) == [(1, 3), (5, 5)]
+    assert splitter._parse_page_range(" 2 - 4 , 7 ", 10) == [(2, 4), (7, 7)]
+
+
+def test_reversed_range_keeps_start_page(splitter):
+    """A range whose end is before its start collapses to the start page"""
+    assert splitter._parse_page_range("5-3", 10) == [(5, 5)]
+
+
+def test_out_of_bounds_pages_are_clamped(splitter):
+    """Pages outside the document are clamped to its first and last page"""
+    assert splitter._parse_page_range("0-50", 10) == [(1, 10)]
+    assert splitter._parse_page_range("15", 10) == [(10, 10)]
+
+
+@pytest.mark.parametrize("page_range", ["abc", "1-", "-3", "1-3,,5", "", "1.5", "1-2-3"])
+def test_malformed_input_is_rejected(splitter, page_range):
+    """Anything that is not a page or a page range raises ValueError"""
+    with pytest.raises(ValueError, match="Invalid page range"):
+        splitter._parse_page_range(page_range, 10)
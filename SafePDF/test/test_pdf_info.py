@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached reader shared by get_pdf_info and extract_hidden_info
+"""
+
+import threading
+
+from PyPDF2 import PdfWriter
+
+from SafePDF.ops.pdf_operations import PDFOperations
+
+
+def _write_sample_pdf(path):
+    """Write a five-page PDF with a title, author and one custom info entry"""
+    writer = PdfWriter()
+    for _ in range(5):
+        writer.add_blank_page(width=200, height=200)
+    writer.add_metadata({"/Title": "Sample", "/Author": "SafePDF", "/Custom": "hidden"})
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+def test_info_and_extract_share_reader_across_threads(tmp_path):
+    """The Tk-thread info lookup and the worker extraction can use the cached reader at once"""
+    input_path = _write_sample_pdf(tmp_path / "sample.pdf")
+    pdf_ops = PDFOperations()
+    infos = []
+    stop = threading.Event()
+
+    def _poll_info():
+        while not stop.is_set():
+            infos.append(pdf_ops.get_pdf_info(input_path))
+
+    poller = threading.Thread(target=_poll_info)
+    poller.start()
+    try:
+        for i in range(20):
+            output_path = tmp_path / f"info_{i}.txt"
+            success, message = pdf_ops.extract_hidden_info(input_path, str(output_path))
+            assert success, message
+            text = output_path.read_text(encoding="utf-8")
+            assert "Title: Sample" in text
+            assert "/Custom: hidden" in text
+    finally:
+        stop.set()
+        poller.join()
+
+    assert infos
+    assert all(info.get("title") == "Sample" and info.get("pages") == 5 for info in infos)
+    # Both threads were served by the one cached reader
+    assert len(pdf_ops._reader_cache) == 1
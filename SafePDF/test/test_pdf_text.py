@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for page text extraction with pypdfium2 in PDF to TXT and PDF to Word
+"""
+
+import pytest
+
+from SafePDF.ops.pdf_operations import PDFOperations
+
+
+def _write_hyphenated_pdf(path):
+    """Write a one-page PDF whose first line ends in a word hyphenated onto the next line"""
+    content = b"BT /F1 12 Tf 72 720 Td 14 TL (Careful manip-) Tj T* (ulation of the text.) Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+        b" /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    path.write_bytes(bytes(data))
+    return str(path)
+
+
+def test_txt_rejoins_hyphenated_words(tmp_path):
+    """PDFium's U+FFFE soft-hyphen marker never reaches the text file"""
+    input_path = _write_hyphenated_pdf(tmp_path / "hyphenated.pdf")
+    output_path = tmp_path / "hyphenated.txt"
+
+    success, message = PDFOperations().pdf_to_txt(input_path, str(output_path))
+
+    assert success, message
+    text = output_path.read_text(encoding="utf-8")
+    assert "manipulation" in text
+    assert "\ufffe" not in text
+    assert "\r" not in text
+
+
+def test_word_converts_hyphenated_page(tmp_path):
+    """A soft-hyphenated page converts to Word with and without page images"""
+    docx = pytest.importorskip("docx")
+    input_path = _write_hyphenated_pdf(tmp_path / "hyphenated.pdf")
+
+    for include_images in (True, False):
+        output_path = tmp_path / f"hyphenated_{include_images}.docx"
+
+        success, message = PDFOperations().pdf_to_word(input_path, str(output_path), include_images)
+
+        assert success, message
+        text = "\n".join(paragraph.text for paragraph in docx.Document(str(output_path)).paragraphs)
+        assert "manipulation" in text
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the SHA-256 checksum gate used before update signature verification
+"""
+
+import hashlib
+
+import pytest
+
+from SafePDF.logger.logging_config import get_logger
+from SafePDF.ops.updates import SafePDFUpdates
+
+RELEASE_DATA = b"SafePDF release payload"
+RELEASE_DIGEST = hashlib.sha256(RELEASE_DATA).hexdigest()
+
+
+def _make_updates():
+    """Create an updater without contacting GitHub or initializing GPG"""
+    updates = SafePDFUpdates.__new__(SafePDFUpdates)
+    updates.logger = get_logger("SafePDF.Updates")
+    updates.gpg = None
+    updates.gpg_available = True
+    updates._verify_cache = {}
+    # A key is already loaded, so no default key import is attempted
+    updates._pgp_keys = {"test": None}
+    return updates
+
+
+def _write(path, data):
+    """Write bytes to path and return its file:// URL"""
+    path.write_bytes(data)
+    return path.as_uri()
+
+
+def test_bare_digest_is_accepted(tmp_path):
+    """A checksum asset holding only the hex digest applies to the download"""
+    updates = _make_updates()
+    checksum_url = _write(tmp_path / "SafePDF-linux.tar.gz.sha256", f"{RELEASE_DIGEST}\n".encode())
+    download_url = "https://example.com/download/SafePDF-linux.tar.gz"
+
+    assert updates._fetch_expected_digest(checksum_url, download_url) == bytes.fromhex(RELEASE_DIGEST)
+
+
+def test_sha256sums_entry_is_matched_by_file_name(tmp_path):
+    """Only the line naming the downloaded asset is used from a SHA256SUMS list"""
+    updates = _make_updates()
+    other_digest = hashlib.sha256(b"other").hexdigest()
+    listing = f"{other_digest}  SafePDF-windows.exe\n{RELEASE_DIGEST} *SafePDF-linux.tar.gz\n"
+    checksum_url = _write(tmp_path / "SHA256SUMS", listing.encode())
+    download_url = "https://example.com/download/SafePDF-linux.tar.gz"
+
+    assert updates._fetch_expected_digest(checksum_url, download_url) == bytes.fromhex(RELEASE_DIGEST)
+
+
+def test_missing_entry_is_rejected(tmp_path):
+    """A checksum list without an entry for the download raises instead of passing"""
+    updates = _make_updates()
+    checksum_url = _write(tmp_path / "SHA256SUMS", f"{RELEASE_DIGEST}  SafePDF-windows.exe\n".encode())
+    download_url = "https://example.com/download/SafePDF-linux.tar.gz"
+
+    with pytest.raises(Exception, match="No SHA-256 checksum for safepdf-linux.tar.gz"):
+        updates._fetch_expected_digest(checksum_url, download_url)
+
+
+def test_malformed_digest_is_rejected(tmp_path):
+    """A non-hex digest is never treated as a match"""
+    updates = _make_updates()
+    checksum_url = _write(tmp_path / "SafePDF-linux.tar.gz.sha256", b"not-a-digest  SafePDF-linux.tar.gz\n")
+    download_url = "https://example.com/download/SafePDF-linux.tar.gz"
+
+    with pytest.raises(Exception, match="No SHA-256 checksum"):
+        updates._fetch_expected_digest(checksum_url, download_url)
+
+
+def test_digest_mismatch_fails_verification(tmp_path):
+    """A download whose digest differs from the listed one is rejected after one retry"""
+    updates = _make_updates()
+    download_url = _write(tmp_path / "SafePDF-linux.tar.gz", RELEASE_DATA)
+    wrong_digest = hashlib.sha256(b"tampered").hexdigest()
+    checksum_url = _write(tmp_path / "SafePDF-linux.tar.gz.sha256", f"{wrong_digest}\n".encode())
+
+    downloads = []
+    download_file = updates._download_file
+
+    def _counting_download(url, dest_path):
+        downloads.append(url)
+        return download_file(url, dest_path)
+
+    updates._download_file = _counting_download
+    success, file_path, message = updates.download_and_verify(
+        download_url, signature_url="file:///nonexistent.sig", checksum_url=checksum_url
+    )
+
+    assert not success
+    assert file_path is None
+    assert message == "Checksum verification failed"
+    # The release is fetched twice and the signature never is
+    assert downloads == [download_url, download_url]
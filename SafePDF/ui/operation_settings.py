@@ -30,8 +30,10 @@ class OperationSettingsUI:
         self.img_quality_var = None
         self.split_var = None
         self.page_range_var = None
+        self.split_chunk_var = None
         self.repair_var = None
         self.merge_var = None
+        self.word_images_var = None
         self.use_default_output = None
         self.output_path_var = None
 
@@ -223,10 +225,11 @@ class OperationSettingsUI:
                 files_frame, text="No files selected", foreground="#999", style="Gray.TLabel"
             ).pack(anchor="w", padx=10)
 
-    def create_split_settings(self, split_var, page_range_var):
+    def create_split_settings(self, split_var, page_range_var, split_chunk_var):
         """Create settings for PDF splitting"""
         self.split_var = split_var
         self.page_range_var = page_range_var
+        self.split_chunk_var = split_chunk_var
 
         ttk.Label(self.settings_container, text="Split Method:").pack(
             anchor="w", pady=5
@@ -241,6 +244,15 @@ class OperationSettingsUI:
             split_frame, text="Split by range", variable=self.split_var, value="range"
         ).pack(anchor="w")
 
+        # Pages per output file when splitting by pages; fewer, larger files split faster
+        chunk_frame = ttk.Frame(self.settings_container)
+        chunk_frame.pack(anchor="w", pady=5)
+
+        ttk.Label(chunk_frame, text="Pages per file (split by pages):").pack(side="left")
+        ttk.Spinbox(
+            chunk_frame, from_=1, to=9999, width=6, textvariable=self.split_chunk_var
+        ).pack(side="left", padx=5)
+
         # Add range entry for custom ranges
         range_frame = ttk.Frame(self.settings_container)
         range_frame.pack(anchor="w", pady=5, fill="x")
@@ -249,8 +261,10 @@ class OperationSettingsUI:
         range_entry = ttk.Entry(range_frame, textvariable=self.page_range_var)
         range_entry.pack(anchor="w", fill="x", pady=2)
 
-    def create_to_word_settings(self):
+    def create_to_word_settings(self, word_images_var):
         """Create settings for PDF to Word conversion"""
+        self.word_images_var = word_images_var
+
         ttk.Label(
             self.settings_container,
             text="Convert PDF to Microsoft Word document (.docx)",
@@ -267,13 +281,17 @@ class OperationSettingsUI:
             text="• Attempts to preserve basic formatting",
             foreground="#666",
         ).pack(anchor="w")
-        ttk.Label(
-            info_frame, text="• Includes images where possible", foreground="#666"
-        ).pack(anchor="w")
         ttk.Label(
             info_frame, text="• Requires python-docx and pypdfium2", foreground="#666"
         ).pack(anchor="w")
 
+        # Rendering page images dominates the conversion time
+        ttk.Checkbutton(
+            self.settings_container,
+            text="Include an image of each page (slower)",
+            variable=self.word_images_var,
+        ).pack(anchor="w", pady=5)
+
     def create_to_txt_settings(self):
         """Create settings for PDF to TXT conversion"""
         ttk.Label(
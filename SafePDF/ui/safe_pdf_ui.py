@@ -181,8 +181,10 @@ class SafePDFUI:
         self.img_quality_var = tk.StringVar(value="medium")
         self.split_var = tk.StringVar(value="pages")
         self.page_range_var = tk.StringVar()
+        self.split_chunk_var = tk.StringVar(value="1")
         self.repair_var = tk.BooleanVar(value=True)
         self.merge_var = tk.BooleanVar(value=True)
+        self.word_images_var = tk.BooleanVar(value=True)
         # Merge-specific UI state: second file path and order (end/beginning)
         self.merge_second_file_var = tk.StringVar(value="")
         self.merge_order_var = tk.StringVar(value="end")  # 'end' or 'beginning'
@@ -1310,7 +1312,7 @@ class SafePDFUI:
             page = pdf[0]
             # Calculate scale to fit canvas
             scale = min(canvas_w / page.get_width(), canvas_h / page.get_height()) * 0.8
-            img = page.render(scale=scale).to_pil()
+            img = page.render(scale=scale, rev_byteorder=True).to_pil()
             pdf.close()
 
             img.thumbnail((canvas_w, canvas_h), Image.LANCZOS)
@@ -2558,8 +2560,10 @@ class SafePDFUI:
         ops_ui.img_quality_var = self.img_quality_var
         ops_ui.split_var = self.split_var
         ops_ui.page_range_var = self.page_range_var
+        ops_ui.split_chunk_var = self.split_chunk_var
         ops_ui.repair_var = self.repair_var
         ops_ui.merge_var = self.merge_var
+        ops_ui.word_images_var = self.word_images_var
         ops_ui.use_default_output = self.use_default_output
         ops_ui.output_path_var = self.output_path_var
 
@@ -2580,7 +2584,7 @@ class SafePDFUI:
                 self._on_browse_output
             )
         elif self.controller.selected_operation == "split":
-            ops_ui.create_split_settings(self.split_var, self.page_range_var)
+            ops_ui.create_split_settings(self.split_var, self.page_range_var, self.split_chunk_var)
             ops_ui.create_output_path_selection(
                 True, self.use_default_output, self.output_path_var, 
                 self._on_browse_output
@@ -2604,7 +2608,7 @@ class SafePDFUI:
                 self._on_browse_output
             )
         elif self.controller.selected_operation == "to_word":
-            ops_ui.create_to_word_settings()
+            ops_ui.create_to_word_settings(self.word_images_var)
             ops_ui.create_output_path_selection(
                 False, self.use_default_output, self.output_path_var, 
                 self._on_browse_output
@@ -2945,6 +2949,7 @@ class SafePDFUI:
         elif self.controller.selected_operation == "split":
             settings["method"] = self.split_var.get()
             settings["page_range"] = self.page_range_var.get()
+            settings["chunk_size"] = self.split_chunk_var.get()
         elif self.controller.selected_operation == "to_jpg":
             settings["quality"] = self.img_quality_var.get()
             # Map quality to DPI
@@ -2958,6 +2963,8 @@ class SafePDFUI:
             second = self.merge_second_file_var.get().strip()
             settings["second_file"] = second if second else None
             settings["merge_order"] = self.merge_order_var.get()  # 'end' or 'beginning'
+        elif self.controller.selected_operation == "to_word":
+            settings["include_images"] = self.word_images_var.get()
 
         self.controller.set_operation_settings(settings)
 
@@ -634,7 +634,9 @@ class UpdateUI:
             def perform_download():
                 try:
                     success, file_path, error = self.controller.download_update(
-                        update_info.get("download_url"), update_info.get("signature_url")
+                        update_info.get("download_url"),
+                        update_info.get("signature_url"),
+                        update_info.get("checksum_url"),
                     )
                     download_dlg.destroy()
 